@@ -15,6 +15,14 @@ class CPUManagerApp(App):
     name = "CPU Manager"
     id = "cpu_manager"
 
+    # Keys polled every frame
+    INPUT_KEYS = (
+        Keycode.UP_ARROW,
+        Keycode.DOWN_ARROW,
+        Keycode.ENTER,
+        Keycode.Q,
+    )
+
     # Available frequency presets (in MHz)
     FREQ_PRESETS = [
         (50, "Ultra Low Power", "Slowest, saves power"),
@@ -25,6 +33,13 @@ class CPUManagerApp(App):
         (250, "Maximum", "Overclocked, may be unstable"),
     ]
 
+    # Row labels per preset, formatted once: (freq_mhz, label if current,
+    # label otherwise, description line)
+    PRESET_ROWS = tuple(
+        (freq_mhz, f"* {freq_mhz} MHz - {name}", f"  {freq_mhz} MHz - {name}", f"  {desc}")
+        for freq_mhz, name, desc in FREQ_PRESETS
+    )
+
     def __init__(self, system):
         super().__init__(system)
         self.selected_index = 3  # Default to 150MHz
@@ -86,12 +101,7 @@ class CPUManagerApp(App):
                     self.need_update = True
 
             # Handle input
-            keys = self.sys.keys_pressed([
-                Keycode.UP_ARROW,
-                Keycode.DOWN_ARROW,
-                Keycode.ENTER,
-                Keycode.Q
-            ])
+            keys = self.sys.keys_pressed(self.INPUT_KEYS)
 
             if keys[Keycode.UP_ARROW]:
                 # Move selection up
@@ -146,7 +156,7 @@ class CPUManagerApp(App):
         self.sys.draw_text("Select Frequency:", 5, y, scale=1, color=(255, 255, 0))
         y += 15
 
-        for i, (freq_mhz, name, desc) in enumerate(self.FREQ_PRESETS):
+        for i, (freq_mhz, current_label, label, desc_label) in enumerate(self.PRESET_ROWS):
             is_selected = (i == self.selected_index)
             is_current = (abs(freq_mhz - self.current_freq_mhz) < 10)
 
@@ -157,13 +167,10 @@ class CPUManagerApp(App):
             else:
                 text_color = (255, 255, 255)
 
-            # Show current frequency indicator
-            prefix = "* " if is_current else "  "
-
-            # Draw preset
-            self.sys.draw_text(f"{prefix}{freq_mhz} MHz - {name}", 5, y, scale=1, color=text_color)
+            # Draw preset ("* " marks the current frequency)
+            self.sys.draw_text(current_label if is_current else label, 5, y, scale=1, color=text_color)
             y += 12
-            self.sys.draw_text(f"  {desc}", 5, y, scale=1, color=text_color if is_selected else (150, 150, 150))
+            self.sys.draw_text(desc_label, 5, y, scale=1, color=text_color if is_selected else (150, 150, 150))
             y += 18
 
             # Stop if running out of space
@@ -2,10 +2,10 @@
 Flashlight App
 
 Simple app that toggles between white and black screen.
-Demonstrates basic app structure and input handling.
+Demonstrates basic app structure, input handling and the tick() protocol.
 """
 
-from slime.app import App
+from slime.app import App, EXIT
 from lib.keycode import Keycode
 
 
@@ -15,8 +15,12 @@ class FlashlightApp(App):
     name = "Flashlight"
     id = "flashlight"
 
-    def run(self):
-        """Main app loop"""
+    # Keys polled every frame
+    INPUT_KEYS = (Keycode.ENTER, Keycode.Q)
+
+    def on_enter(self):
+        """Set up app state (tick() apps have no run() preamble)"""
+        super().on_enter()
         self.sys.log.info("Flashlight starting")
         self.led_on = False  # Start with light on
         self.need_update = True
@@ -28,40 +32,39 @@ class FlashlightApp(App):
         self.TEXT_QUIT = "[Q] Quit"
 
         # Memory debugging - log every 60 frames
-        frame_count = 0
-        log_interval = 60
-
-        while True:
-            frame_count += 1
-
-            # Log memory usage periodically
-            if frame_count % log_interval == 0:
-                import gc
-                gc.collect()
-                mem = self.sys.memory_info()
-                self.sys.log.debug(f"Flashlight frame {frame_count}: {mem['free']//1024}KB free, {mem['percent_used']:.1f}% used")
-
-            keys = self.sys.keys_pressed([Keycode.ENTER, Keycode.Q])
-            # Check if any key was pressed
-            if any(keys.values()):
-                self.need_update = True
-
-            if keys[Keycode.ENTER]:
-                # Toggle state
-                self.led_on = not self.led_on
-
-            if keys[Keycode.Q]:
-                # Exit app (returns to launcher)
-                return
-
-            # Handle input
-            if self.need_update:
-                self._draw_ui()
-                self.sys.update()
-                self.need_update = False
-
-            # Return control to OS
-            yield
+        self.frame_count = 0
+        self.log_interval = 60
+
+    def tick(self):
+        """One frame of the app (called by the OS every frame)"""
+        self.frame_count += 1
+
+        # Log memory usage periodically (only when debug logging is on)
+        if self.frame_count % self.log_interval == 0 and self.sys.log.debug_enabled:
+            mem = self.sys.memory_info(collect=True)
+            self.sys.log.debug(f"Flashlight frame {self.frame_count}: {mem['free']//1024}KB free, {mem['percent_used']}% used")
+
+        keys = self.sys.keys_pressed(self.INPUT_KEYS)
+        # Check if any key was pressed
+        if any(keys.values()):
+            self.need_update = True
+
+        if keys[Keycode.ENTER]:
+            # Toggle state
+            self.led_on = not self.led_on
+
+        if keys[Keycode.Q]:
+            # Exit app (returns to launcher)
+            return EXIT
+
+        # Handle input
+        if self.need_update:
+            self._draw_ui()
+            self.sys.update()
+            self.need_update = False
+
+        # Keep running
+        return None
 
     def _draw_ui(self):
         """Draw UI based on state"""
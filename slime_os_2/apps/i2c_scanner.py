@@ -15,6 +15,24 @@ class I2CScannerApp(App):
     name = "I2C Scanner"
     id = "i2c_scanner"
 
+    # Keys polled every frame
+    INPUT_KEYS = (
+        Keycode.LEFT_ARROW,
+        Keycode.RIGHT_ARROW,
+        Keycode.R,
+        Keycode.Q,
+    )
+
+    # Address grid layout: 16 columns x 8 rows = 128 addresses
+    GRID_COLS = 16
+    GRID_ROWS = 8
+    CELL_WIDTH = 18
+    CELL_HEIGHT = 14
+    GRID_X = 5
+
+    BG_COLOR = (0, 16, 32)  # Dark blue background
+    STATUS_Y = 30  # Top of the bus/status lines
+
     def __init__(self, system):
         super().__init__(system)
         self.selected_bus = 1  # Default to I2C1 (keyboard bus on Pico Calc)
@@ -22,6 +40,36 @@ class I2CScannerApp(App):
         self.scanning = False
         self.scan_error = None
         self.need_update = True
+        self._grid_cache = {}  # start_y -> precomputed (rect, text) per address
+        self._drawn_found = None  # Device set on screen (None = full redraw)
+        self._drawn_grid_y = None  # Grid position on screen
+
+    def _grid_cells(self, start_y):
+        """
+        Get precomputed grid geometry and labels for a grid starting at start_y.
+
+        The grid only moves when the status area above it changes height,
+        so cells are built once per position and reused on every redraw.
+
+        Args:
+            start_y: Y position of the first grid row
+
+        Returns:
+            List of ((x, y, w, h), (label, x, y)) tuples indexed by address
+        """
+        cells = self._grid_cache.get(start_y)
+        if cells is None:
+            cells = []
+            w = self.CELL_WIDTH - 2
+            h = self.CELL_HEIGHT - 2
+            for addr in range(self.GRID_ROWS * self.GRID_COLS):
+                row, col = divmod(addr, self.GRID_COLS)
+                x = self.GRID_X + col * self.CELL_WIDTH
+                y = start_y + row * self.CELL_HEIGHT
+                # Address in hex (compact format)
+                cells.append(((x, y, w, h), (f"{addr:02X}", x + 2, y + 2)))
+            self._grid_cache[start_y] = cells
+        return cells
 
     def scan_i2c_bus(self, bus_id):
         """
@@ -90,12 +138,7 @@ class I2CScannerApp(App):
 
         while True:
             # Handle input
-            keys = self.sys.keys_pressed([
-                Keycode.LEFT_ARROW,
-                Keycode.RIGHT_ARROW,
-                Keycode.R,
-                Keycode.Q
-            ])
+            keys = self.sys.keys_pressed(self.INPUT_KEYS)
 
             if keys[Keycode.LEFT_ARROW] and not self.scanning:
                 # Switch to previous bus
@@ -127,15 +170,67 @@ class I2CScannerApp(App):
 
             yield
 
+    def _grid_y(self):
+        """
+        Get the Y position of the first grid row for the current status.
+
+        Returns:
+            Y position (an error message takes one extra status line)
+        """
+        y = self.STATUS_Y + 15  # Bus line
+        y += 27 if self.scan_error else 15  # Status line(s)
+        return y + 20  # Gap + grid header
+
     def _draw_ui(self):
-        """Draw I2C scanner UI"""
+        """Draw I2C scanner UI, repainting only the regions that changed"""
+        found = set(self.found_devices)
+        grid_y = self._grid_y()
+
+        if self._drawn_found is None or grid_y != self._drawn_grid_y:
+            # First draw or the grid moved - repaint everything
+            self._draw_static(grid_y)
+            dirty = range(self.GRID_ROWS * self.GRID_COLS)
+        else:
+            # Same layout - only the status text and changed cells are stale
+            self.sys.draw_rect(0, self.STATUS_Y, self.sys.width,
+                               grid_y - 20 - self.STATUS_Y, self.BG_COLOR)
+            dirty = found ^ self._drawn_found
+
+        self._draw_status()
+        self._draw_cells(grid_y, found, dirty)
+        self._draw_device_list(grid_y)
+
+        self._drawn_found = found
+        self._drawn_grid_y = grid_y
+
+        # Update display
+        self.sys.update()
+
+    def _draw_static(self, grid_y):
+        """
+        Draw the parts of the UI that only change when the layout moves.
+
+        Args:
+            grid_y: Y position of the first grid row
+        """
         # Clear screen
-        self.sys.clear((0, 16, 32))  # Dark blue background
+        self.sys.clear(self.BG_COLOR)
 
         # Title
         self.sys.draw_text("I2C Scanner", 5, 5, scale=2, color=(255, 255, 0))
 
-        y = 30
+        # Grid header
+        self.sys.draw_text("Address Grid (0x00-0x7F):", 5, grid_y - 15, scale=1, color=(200, 200, 200))
+
+        # Controls at bottom
+        controls_y = self.sys.height - 38
+        self.sys.draw_text("[Left/Right] Change Bus", 5, controls_y, scale=1, color=(150, 150, 150))
+        controls_y += 12
+        self.sys.draw_text("[R] Rescan  [Q] Quit", 5, controls_y, scale=1, color=(150, 150, 150))
+
+    def _draw_status(self):
+        """Draw the bus and scan status lines"""
+        y = self.STATUS_Y
 
         # Bus selection
         bus_text = f"Bus: I2C{self.selected_bus}"
@@ -145,66 +240,63 @@ class I2CScannerApp(App):
         # Show scanning status or error
         if self.scanning:
             self.sys.draw_text("Scanning...", 5, y, scale=1, color=(255, 255, 0))
-            y += 15
         elif self.scan_error:
             self.sys.draw_text("Error:", 5, y, scale=1, color=(255, 0, 0))
             y += 12
             self.sys.draw_text(self.scan_error, 5, y, scale=1, color=(255, 100, 100))
-            y += 15
         else:
             # Show device count
             self.sys.draw_text(f"Found: {len(self.found_devices)} devices", 5, y, scale=1, color=(0, 255, 0))
-            y += 15
-
-        # Draw address grid
-        if not self.scanning:
-            y += 5
-            self.sys.draw_text("Address Grid (0x00-0x7F):", 5, y, scale=1, color=(200, 200, 200))
-            y += 15
-
-            # Draw grid: 16 columns x 8 rows = 128 addresses
-            cell_width = 18
-            cell_height = 14
-            start_x = 5
-            start_y = y
-
-            for row in range(8):
-                for col in range(16):
-                    addr = row * 16 + col
-                    x = start_x + col * cell_width
-                    y = start_y + row * cell_height
-
-                    # Check if device found at this address
-                    if addr in self.found_devices:
-                        # Found - green background
-                        self.sys.draw_rect(x, y, cell_width - 2, cell_height - 2, (0, 150, 0))
-                        text_color = (255, 255, 255)
-                    else:
-                        # Not found - dark background
-                        self.sys.draw_rect(x, y, cell_width - 2, cell_height - 2, (32, 32, 48))
-                        text_color = (100, 100, 100)
-
-                    # Draw address in hex (compact format)
-                    addr_text = f"{addr:02X}"
-                    self.sys.draw_text(addr_text, x + 2, y + 2, scale=1, color=text_color)
-
-            # Draw found device list at bottom
-            if self.found_devices:
-                y = start_y + 8 * cell_height + 10
-                self.sys.draw_text("Devices:", 5, y, scale=1, color=(255, 255, 0))
-                y += 12
-
-                # Show up to 5 devices with their addresses
-                device_text = ", ".join([f"0x{addr:02X}" for addr in self.found_devices[:8]])
-                if len(device_text) > 48:
-                    device_text = device_text[:45] + "..."
-                self.sys.draw_text(device_text, 5, y, scale=1, color=(0, 255, 0))
 
-        # Controls at bottom
-        controls_y = self.sys.height - 38
-        self.sys.draw_text("[Left/Right] Change Bus", 5, controls_y, scale=1, color=(150, 150, 150))
-        controls_y += 12
-        self.sys.draw_text("[R] Rescan  [Q] Quit", 5, controls_y, scale=1, color=(150, 150, 150))
+    def _draw_cells(self, grid_y, found, dirty):
+        """
+        Draw grid cells for the given addresses.
 
-        # Update display
-        self.sys.update()
+        Args:
+            grid_y: Y position of the first grid row
+            found: Set of addresses with a device
+            dirty: Addresses whose cells need repainting
+        """
+        cells = self._grid_cells(grid_y)
+
+        # Group cells by color so each group is drawn with one pen switch
+        found_rects = []
+        found_texts = []
+        empty_rects = []
+        empty_texts = []
+        for addr in dirty:
+            rect, text = cells[addr]
+            # Check if device found at this address
+            if addr in found:
+                found_rects.append(rect)
+                found_texts.append(text)
+            else:
+                empty_rects.append(rect)
+                empty_texts.append(text)
+
+        # Found - green background, white text
+        self.sys.draw_rects(found_rects, (0, 150, 0))
+        self.sys.draw_texts(found_texts, scale=1, color=(255, 255, 255))
+        # Not found - dark background, gray text
+        self.sys.draw_rects(empty_rects, (32, 32, 48))
+        self.sys.draw_texts(empty_texts, scale=1, color=(100, 100, 100))
+
+    def _draw_device_list(self, grid_y):
+        """
+        Draw the found device list below the grid.
+
+        Args:
+            grid_y: Y position of the first grid row
+        """
+        y = grid_y + self.GRID_ROWS * self.CELL_HEIGHT + 10
+        self.sys.draw_rect(0, y, self.sys.width, 24, self.BG_COLOR)
+
+        if self.found_devices:
+            self.sys.draw_text("Devices:", 5, y, scale=1, color=(255, 255, 0))
+            y += 12
+
+            # Show up to 8 devices with their addresses
+            device_text = ", ".join([f"0x{addr:02X}" for addr in self.found_devices[:8]])
+            if len(device_text) > 48:
+                device_text = device_text[:45] + "..."
+            self.sys.draw_text(device_text, 5, y, scale=1, color=(0, 255, 0))
@@ -40,6 +40,14 @@ class KeyboardTestApp(App):
         # Build reverse lookup for raw mode
         keycode_to_name = {kc: name for name, kc in all_keycodes}
 
+        # Normal mode polling state, built once: keycodes to poll in a single
+        # keys_pressed() call, their history labels, and the previous frame's
+        # pressed flags (so only new presses are recorded, with no per-frame
+        # allocation)
+        poll_keycodes = tuple(kc for _, kc in all_keycodes)
+        poll_labels = tuple((name, hex(kc)) for name, kc in all_keycodes)
+        prev_pressed = bytearray(len(poll_keycodes))
+
         while True:
             key_pressed = False
 
@@ -75,15 +83,18 @@ class KeyboardTestApp(App):
                         self.key_history.append(("ERROR", "Raw mode not supported"))
                         key_pressed = True
             else:
-                # NORMAL MODE - Check all keycodes
-                for key_name, keycode_value in all_keycodes:
-                    if self.sys.key_pressed(keycode_value):
-                        # Add to history
-                        self.key_history.append((key_name, hex(keycode_value)))
+                # NORMAL MODE - Check all keycodes in one call
+                keys = self.sys.keys_pressed(poll_keycodes)
+                for i in range(len(poll_keycodes)):
+                    pressed = 1 if keys[poll_keycodes[i]] else 0
+                    if pressed and not prev_pressed[i]:
+                        # Newly pressed - add to history
+                        self.key_history.append(poll_labels[i])
                         # Keep only max_history items
                         if len(self.key_history) > self.max_history:
                             self.key_history.pop(0)
                         key_pressed = True
+                    prev_pressed[i] = pressed
 
             # Check for mode toggle (R key) - only in normal mode
             if not self.raw_mode and self.sys.key_pressed(Keycode.R):
@@ -99,11 +110,11 @@ class KeyboardTestApp(App):
             # Check for quit
             if self.sys.key_pressed(Keycode.ESCAPE):
                 # In raw mode, use raw code check
-                if self.raw_mode:
-                    if hasattr(self.sys.input, 'inv_map'):
-                        esc_raw = self.sys.input.inv_map.get(Keycode.ESCAPE)
-                        if esc_raw and self.sys.input.held.get(esc_raw, False):
-                            return
+                # (drivers without raw key state, e.g. the simulator, just quit)
+                if self.raw_mode and hasattr(self.sys.input, 'held'):
+                    esc_raw = self.sys.input.inv_map.get(Keycode.ESCAPE)
+                    if esc_raw and self.sys.input.held[esc_raw]:
+                        return
                 else:
                     return
 
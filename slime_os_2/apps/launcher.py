@@ -5,7 +5,7 @@ Built-in app that displays available apps and lets user launch them.
 This is the "home screen" of Slime OS.
 """
 
-from slime.app import App
+from slime.app import App, LaunchRequest
 from lib.keycode import Keycode
 import os
 
@@ -24,38 +24,81 @@ class Launcher(App):
     name = "Launcher"
     id = "launcher"
 
+    # Keys polled every frame
+    INPUT_KEYS = (
+        Keycode.UP_ARROW,
+        Keycode.DOWN_ARROW,
+        Keycode.ENTER,
+    )
+
+    # Discovered app classes, shared by every Launcher instance, and the
+    # apps/ listing they were discovered from. Apps are only re-imported
+    # and inspected when the listing changes, not on every return home.
+    _discovered_apps = None
+    _discovered_files = None
+    _app_labels = ()  # Row label per discovered app, formatted once
+
+    # Layout
+    BG_COLOR = (0, 0, 64)  # Dark blue background
+    LIST_Y = 80  # Y position of the first app row
+    ROW_HEIGHT = 20
+
     def __init__(self, system):
         super().__init__(system)
         self.apps = []
         self.selected_index = 0
         self.need_update = True
+        self._drawn_index = None  # Selection on screen (None = full redraw)
+
+    def list_app_files(self):
+        """
+        List the files in the apps/ directory.
+
+        Returns:
+            Sorted tuple of filenames (empty if apps/ can't be read)
+        """
+        try:
+            files = os.listdir('apps')
+        except:
+            files = []
+        files.sort()
+        return tuple(files)
 
-    def discover_apps(self):
+    def discover_apps(self, files=None):
         """
         Discover available apps by scanning apps/ directory.
 
+        Args:
+            files: Filenames in apps/ (from list_app_files()); listed here if None
+
         Returns:
             List of app classes
         """
         apps = []
 
         # Get list of Python files in apps/ directory
-        try:
-            files = os.listdir('apps')
-        except:
-            files = []
+        if files is None:
+            files = self.list_app_files()
 
+        seen = set()
         for filename in files:
             # Skip non-Python files and special files
-            if not filename.endswith('.py'):
+            # (apps may be deployed as source or as precompiled .mpy)
+            if filename.endswith('.py'):
+                module_name = filename[:-3]  # Remove .py
+            elif filename.endswith('.mpy'):
+                module_name = filename[:-4]  # Remove .mpy
+            else:
                 continue
             if filename.startswith('_'):
                 continue
-            if filename == 'launcher.py':
+            if module_name == 'launcher':
                 continue  # Don't list launcher itself
+            if module_name in seen:
+                continue  # Both .py and .mpy present - import once
+            seen.add(module_name)
 
             # Try to import the app
-            module_name = filename[:-3]  # Remove .py
             try:
                 # Dynamic import
                 # MicroPython's __import__ doesn't accept keyword arguments
@@ -69,34 +112,44 @@ class Launcher(App):
                         attr != App and
                         hasattr(attr, 'name') and
                         hasattr(attr, 'id')):
-                        apps.append(attr)
+                        # Decorated with (name, discovery order) so the sort
+                        # below compares tuples in C, never the classes
+                        apps.append((attr.name, len(apps), attr))
                         break
 
             except Exception as e:
                 print(f"[Launcher] Failed to import {module_name}: {e}")
                 self.sys.log.error(f"Launcher: Failed to import {module_name}: {e}")
 
-        # Sort by name
-        apps.sort(key=lambda app: app.name)
+        # Sort by name (no per-item key lambda call), then undecorate
+        apps.sort()
 
-        return apps
+        return [app for _, _, app in apps]
 
     def run(self):
         """Main launcher loop"""
-        # Discover available apps
-        self.sys.log.info("Launcher: Discovering apps")
-        self.apps = self.discover_apps()
-        self.sys.log.info(f"Launcher: Found {len(self.apps)} apps")
+        # Discover available apps - a directory listing is cheap, importing
+        # and inspecting every app module is not, so only redo that when
+        # the listing changed since the last launch
+        files = self.list_app_files()
+        if files != Launcher._discovered_files:
+            self.sys.log.info("Launcher: Discovering apps")
+            Launcher._discovered_apps = self.discover_apps(files)
+            Launcher._discovered_files = files
+            Launcher._app_labels = tuple(f"> {app.name}" for app in Launcher._discovered_apps)
+            self.sys.log.info(f"Launcher: Found {len(Launcher._discovered_apps)} apps")
+        self.apps = Launcher._discovered_apps
         self.need_update = True
 
         # Handle case of no apps
         if not self.apps:
             self.sys.log.warn("Launcher: No apps found")
+            # Screen is static - draw once, then just idle at the frame rate
+            self.sys.clear((128, 0, 0))  # Red
+            self.sys.draw_text("NO APPS FOUND", 20, 20, scale=2)
+            self.sys.draw_text("Add apps to apps/", 20, 60)
+            self.sys.update()
             while True:
-                self.sys.clear((128, 0, 0))  # Red
-                self.sys.draw_text("NO APPS FOUND", 20, 20, scale=2)
-                self.sys.draw_text("Add apps to apps/", 20, 60)
-                self.sys.update()
                 yield
 
         # Main loop
@@ -108,46 +161,64 @@ class Launcher(App):
                 self.need_update = False
 
             # Handle input
-            keys = self.sys.keys_pressed([
-                Keycode.UP_ARROW,
-                Keycode.DOWN_ARROW,
-                Keycode.ENTER
-            ])
+            keys = self.sys.keys_pressed(self.INPUT_KEYS)
 
             # Check if any key was pressed
             if any(keys.values()):
                 self.need_update = True
 
             if keys[Keycode.UP_ARROW]:
-                # Move selection up
-                self.selected_index = self.selected_index - 1
-                # wrap around if at the top
-                if self.selected_index < 0:
-                    self.selected_index = len(self.apps) - 1
+                # Move selection up (wraps around to the bottom)
+                self.selected_index = (self.selected_index - 1) % len(self.apps)
 
             if keys[Keycode.DOWN_ARROW]:
-                # Move selection down
-                self.selected_index = self.selected_index + 1
-                # wrap around if at the bottom
-                if self.selected_index >= len(self.apps):
-                    self.selected_index = 0
+                # Move selection down (wraps around to the top)
+                self.selected_index = (self.selected_index + 1) % len(self.apps)
 
             if keys[Keycode.ENTER]:
                 # Launch selected app
                 selected_app = self.apps[self.selected_index]
                 self.sys.log.debug(f"Launcher: Launching {selected_app.name}")
-                return ('launch', selected_app)
+                return LaunchRequest(selected_app)
 
             yield
 
     def _draw_ui(self):
-        """Draw launcher UI"""
+        """Draw launcher UI, repainting only the rows whose selection changed"""
+        if self._drawn_index is None:
+            # First draw - paint everything
+            self._draw_static()
+            for i in range(self._visible_count()):
+                self._draw_app_row(i)
+        elif self.selected_index != self._drawn_index:
+            # Only the old and new selection rows look different
+            self._draw_app_row(self._drawn_index)
+            self._draw_app_row(self.selected_index)
+        else:
+            return  # Nothing changed on screen
+
+        self._drawn_index = self.selected_index
+
+        # Update display
+        self.sys.update()
+
+    def _visible_count(self):
+        """
+        Get the number of app rows that fit above the instructions.
+
+        Returns:
+            Row count (at least one row is always shown)
+        """
+        fit = (self.sys.height - 60 - self.LIST_Y) // self.ROW_HEIGHT
+        return min(len(self.apps), 1 + max(0, fit))
+
+    def _draw_static(self):
+        """Draw the parts of the UI that don't depend on the selection"""
         # Clear screen
-        self.sys.clear((0, 0, 64))  # Dark blue background
+        self.sys.clear(self.BG_COLOR)
 
         # Draw title
         self.sys.draw_text("SLIME OS", 10, 10, scale=2, color=(255, 255, 0))
-            # Update display
 
         # Draw device name and memory
         mem = self.sys.memory_info()
@@ -155,30 +226,30 @@ class Launcher(App):
         self.sys.draw_text(self.sys.device.name, 10, 40, scale=1, color=(200, 200, 200))
         self.sys.draw_text(mem_text, 10, 55, scale=1, color=(200, 200, 200))
 
-        # Draw app list
-        y = 80
-        for i, app in enumerate(self.apps):
-            if i == self.selected_index:
-                # Selected app - highlight
-                self.sys.draw_rect(5, y - 2, self.sys.width - 10, 16, (255, 255, 0))
-                color = (0, 0, 0)  # Black text on yellow
-            else:
-                # Normal app
-                color = (255, 255, 255)  # White text
-
-            # Draw app name
-            self.sys.draw_text(f"> {app.name}", 10, y, scale=1, color=color)
-
-            y += 20
-
-            # Stop if we run out of space
-            if y > self.sys.height - 60:
-                break
-
         # Draw instructions at bottom
         instructions_y = self.sys.height - 40
         self.sys.draw_text("[Up/Down] Select", 10, instructions_y, scale=1, color=(200, 200, 200))
         self.sys.draw_text("[Enter] Launch", 10, instructions_y + 15, scale=1, color=(200, 200, 200))
 
-        # Update display
-        self.sys.update()
+    def _draw_app_row(self, index):
+        """
+        Draw one app row, highlighted if it is the selected app.
+
+        Args:
+            index: Index into self.apps (rows past the visible area are skipped)
+        """
+        if index >= self._visible_count():
+            return
+
+        y = self.LIST_Y + index * self.ROW_HEIGHT
+        if index == self.selected_index:
+            # Selected app - highlight
+            self.sys.draw_rect(5, y - 2, self.sys.width - 10, 16, (255, 255, 0))
+            color = (0, 0, 0)  # Black text on yellow
+        else:
+            # Normal app - paint over any old highlight
+            self.sys.draw_rect(5, y - 2, self.sys.width - 10, 16, self.BG_COLOR)
+            color = (255, 255, 255)  # White text
+
+        # Draw app name
+        self.sys.draw_text(self._app_labels[index], 10, y, scale=1, color=color)
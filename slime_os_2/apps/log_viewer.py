@@ -14,6 +14,23 @@ class LogViewerApp(App):
     name = "Log Viewer"
     id = "log_viewer"
 
+    # Keys polled every frame
+    INPUT_KEYS = (
+        Keycode.UP_ARROW,
+        Keycode.DOWN_ARROW,
+        Keycode.C,
+        Keycode.M,
+        Keycode.Q,
+    )
+
+    # Per-level line prefix and color (built once, not per drawn line)
+    LEVEL_STYLES = {
+        "ERROR": ("E:", (255, 0, 0)),  # Red
+        "WARN": ("W:", (255, 255, 0)),  # Yellow
+        "DEBUG": ("D:", (128, 128, 128)),  # Gray
+        "INFO": ("I:", (255, 255, 255)),  # White
+    }
+
     def on_cleanup(self):
         """Clean up cached logs to free memory"""
         super().on_cleanup()
@@ -28,23 +45,20 @@ class LogViewerApp(App):
         self.last_log_count = 0
         # Cache logs - only copy when count changes
         self.cached_logs = []
+        # Message text starts after the constant-width level prefix
+        # (measured once, not on every redraw)
+        self.message_x = 5 + self.sys.measure_text("E: ")
 
         while True:
-            # Only get logs if count changed (avoid copying every frame)
-            current_log_count = len(self.sys.log.messages)
+            # Only get logs if new messages were logged (avoid copying every frame)
+            current_log_count = self.sys.log.total
             if current_log_count != self.last_log_count:
                 self.cached_logs = self.sys.log.get_all()
                 self.need_update = True
                 self.last_log_count = current_log_count
 
             # Handle input
-            keys = self.sys.keys_pressed([
-                Keycode.UP_ARROW,
-                Keycode.DOWN_ARROW,
-                Keycode.C,
-                Keycode.M,
-                Keycode.Q
-            ])
+            keys = self.sys.keys_pressed(self.INPUT_KEYS)
 
             if keys[Keycode.UP_ARROW]:
                 # Scroll up (show older logs)
@@ -67,18 +81,16 @@ class LogViewerApp(App):
 
             if keys[Keycode.M]:
                 # Memory debug - add test lines and log memory usage
-                import gc
                 for i in range(10):
-                    self.sys.log.debug(f"Test log line {i + 1}")
+                    self.sys.log.info(f"Test log line {i + 1}")
 
                 # Log memory info
-                gc.collect()
-                mem = self.sys.memory_info()
-                self.sys.log.info(f"MEM: {mem['free']//1024}KB free, {mem['allocated']//1024}KB used ({mem['percent_used']:.1f}%)")
+                mem = self.sys.memory_info(collect=True)
+                self.sys.log.info(f"MEM: {mem['free']//1024}KB free, {mem['allocated']//1024}KB used ({mem['percent_used']}%)")
 
                 # Force cache update
                 self.cached_logs = self.sys.log.get_all()
-                self.last_log_count = len(self.sys.log.messages)
+                self.last_log_count = self.sys.log.total
                 self.need_update = True
 
             if keys[Keycode.Q]:
@@ -102,34 +114,33 @@ class LogViewerApp(App):
         y = 35
         line_height = 12
 
-        # Calculate which logs to show
+        # Calculate which logs to show (indexed - no slice copy)
         start_idx = max(0, len(logs) - self.lines_per_page - self.scroll_offset)
         end_idx = len(logs) - self.scroll_offset
-        visible_logs = logs[start_idx:end_idx]
-
-        for timestamp, level, message in visible_logs:
-            # Color by level
-            if level == "ERROR":
-                color = (255, 0, 0)  # Red
-            elif level == "WARN":
-                color = (255, 255, 0)  # Yellow
-            elif level == "DEBUG":
-                color = (128, 128, 128)  # Gray
-            else:  # INFO
-                color = (255, 255, 255)  # White
-
-            # Truncate long messages - use slice to avoid string concat
+
+        message_x = self.message_x
+        info_style = self.LEVEL_STYLES["INFO"]
+
+        # Bind per-line lookups to locals once, outside the line loop
+        draw_text = self.sys.draw_text
+        get_style = self.LEVEL_STYLES.get
+        bottom = self.sys.height - 40
+
+        for i in range(start_idx, end_idx):
+            timestamp, level, message = logs[i]
+            prefix, color = get_style(level, info_style)
+
+            # Truncate long messages
             if len(message) > 36:
-                display_message = message[:33] + "..."
-            else:
-                display_message = message
+                message = message[:33] + "..."
 
-            # Format once and draw
-            line_text = f"{level[0]}: {display_message}"
-            self.sys.draw_text(line_text, 5, y, scale=1, color=color)
+            # Prefix and message drawn separately - no per-line formatting
+            # (positional args - no keyword dict per call)
+            draw_text(prefix, 5, y, 1, color)
+            draw_text(message, message_x, y, 1, color)
             y += line_height
 
-            if y > self.sys.height - 40:
+            if y > bottom:
                 break
 
         # Controls at bottom
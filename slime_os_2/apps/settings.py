@@ -19,6 +19,17 @@ class SettingsApp(App):
     name = "Settings"
     id = "settings"
 
+    # Keys polled every frame
+    INPUT_KEYS = (
+        Keycode.UP_ARROW,
+        Keycode.DOWN_ARROW,
+        Keycode.LEFT_ARROW,
+        Keycode.RIGHT_ARROW,
+        Keycode.ENTER,
+        Keycode.Q,
+        Keycode.S,
+    )
+
     # CPU frequency presets (in MHz)
     CPU_PRESETS = [50, 100, 125, 133, 150, 175, 200, 225, 250]
 
@@ -50,15 +61,7 @@ class SettingsApp(App):
                     self.need_update = True
 
             # Handle input
-            keys = self.sys.keys_pressed([
-                Keycode.UP_ARROW,
-                Keycode.DOWN_ARROW,
-                Keycode.LEFT_ARROW,
-                Keycode.RIGHT_ARROW,
-                Keycode.ENTER,
-                Keycode.Q,
-                Keycode.S
-            ])
+            keys = self.sys.keys_pressed(self.INPUT_KEYS)
 
             if keys[Keycode.UP_ARROW]:
                 # Move selection up
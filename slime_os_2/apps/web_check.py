@@ -15,6 +15,15 @@ class WebTestApp(App):
     name = "Web Test"
     id = "web_test"
 
+    # Keys polled every frame
+    INPUT_KEYS = (
+        Keycode.T,  # Test connection
+        Keycode.C,  # Connect to WiFi
+        Keycode.D,  # Disconnect
+        Keycode.S,  # Status
+        Keycode.Q,  # Quit
+    )
+
     TEST_URL = "http://httpbin.org/get"
 
     def __init__(self, system):
@@ -71,13 +80,7 @@ class WebTestApp(App):
 
         while True:
             # Handle input
-            keys = self.sys.keys_pressed([
-                Keycode.T,  # Test connection
-                Keycode.C,  # Connect to WiFi
-                Keycode.D,  # Disconnect
-                Keycode.S,  # Status
-                Keycode.Q   # Quit
-            ])
+            keys = self.sys.keys_pressed(self.INPUT_KEYS)
 
             if keys[Keycode.T]:
                 # Test web connection
@@ -15,6 +15,17 @@ class WiFiConfigApp(App):
     name = "WiFi Config"
     id = "wifi_config"
 
+    # Keys polled every frame
+    NAV_KEYS = (
+        Keycode.UP_ARROW,
+        Keycode.DOWN_ARROW,
+        Keycode.ENTER,
+        Keycode.T,  # Test connection
+        Keycode.S,  # Save (can't use S in nav mode since it's a letter)
+        Keycode.C,  # Clear
+        Keycode.ESCAPE,  # Quit
+    )
+
     # Keycode to character mapping
     KEYCODE_TO_CHAR = {
         # Lowercase letters
@@ -52,6 +63,19 @@ class WiFiConfigApp(App):
         Keycode.GRAVE_ACCENT: '`',
     }
 
+    # (keycode, char) pairs for the per-frame typing loop (built once, no
+    # dict view iteration or .get() default per key)
+    CHAR_KEYS = tuple(KEYCODE_TO_CHAR.items())
+
+    # Shifted characters for numbers and symbols (built once, not per keypress)
+    SHIFT_MAP = {
+        '0': ')', '1': '!', '2': '@', '3': '#', '4': '$',
+        '5': '%', '6': '^', '7': '&', '8': '*', '9': '(',
+        '-': '_', '=': '+', '[': '{', ']': '}', '\\': '|',
+        ';': ':', "'": '"', ',': '<', '.': '>', '/': '?',
+        '`': '~'
+    }
+
     # Uppercase keycodes set for fast lookup (created once as class constant)
     _UPPERCASE_KEYCODES = {
         Keycode.A_UPPER, Keycode.B_UPPER, Keycode.C_UPPER, Keycode.D_UPPER,
@@ -77,7 +101,7 @@ class WiFiConfigApp(App):
         # Pre-build list of all keycodes to check (created once)
         control_keys = [Keycode.BACKSPACE, Keycode.ENTER, Keycode.ESCAPE]
         modifier_keys = [Keycode.LEFT_SHIFT, Keycode.RIGHT_SHIFT]
-        self._all_keys_to_check = control_keys + modifier_keys + list(self.KEYCODE_TO_CHAR.keys())
+        self._all_keys_to_check = tuple(control_keys + modifier_keys + list(self.KEYCODE_TO_CHAR.keys()))
 
         # Field names
         self.fields = ["SSID", "Password", "Auto-Connect"]
@@ -125,20 +149,13 @@ class WiFiConfigApp(App):
                 else:
                     # Check character keys - iterate through KEYCODE_TO_CHAR once
                     # Uppercase keycodes are already in KEYCODE_TO_CHAR, so they'll be checked naturally
-                    for keycode, char in self.KEYCODE_TO_CHAR.items():
-                        if keys.get(keycode, False):
+                    for keycode, char in self.CHAR_KEYS:
+                        if keys[keycode]:
                             # Apply shift transformations for non-letter characters only
                             # (Letters are handled by caps lock via uppercase keycodes)
                             if shift_pressed and keycode not in self._UPPERCASE_KEYCODES:
                                 # For numbers and symbols, shift changes the character
-                                shift_map = {
-                                    '0': ')', '1': '!', '2': '@', '3': '#', '4': '$',
-                                    '5': '%', '6': '^', '7': '&', '8': '*', '9': '(',
-                                    '-': '_', '=': '+', '[': '{', ']': '}', '\\': '|',
-                                    ';': ':', "'": '"', ',': '<', '.': '>', '/': '?',
-                                    '`': '~'
-                                }
-                                char = shift_map.get(char, char)
+                                char = self.SHIFT_MAP.get(char, char)
 
                             if self.selected_index == 0:
                                 self.ssid += char
@@ -150,15 +167,7 @@ class WiFiConfigApp(App):
 
             else:
                 # Navigation mode
-                keys = self.sys.keys_pressed([
-                    Keycode.UP_ARROW,
-                    Keycode.DOWN_ARROW,
-                    Keycode.ENTER,
-                    Keycode.T,  # Test connection
-                    Keycode.S,  # Save (can't use S in nav mode since it's a letter)
-                    Keycode.C,  # Clear
-                    Keycode.ESCAPE  # Quit
-                ])
+                keys = self.sys.keys_pressed(self.NAV_KEYS)
 
                 if keys[Keycode.UP_ARROW]:
                     if self.selected_index > 0:
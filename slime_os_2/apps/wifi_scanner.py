@@ -20,6 +20,16 @@ class WiFiScannerApp(App):
     name = "WiFi Scanner"
     id = "wifi_scanner"
 
+    # Keys polled every frame
+    LIST_KEYS = (
+        Keycode.UP_ARROW,
+        Keycode.DOWN_ARROW,
+        Keycode.ENTER,
+        Keycode.R,
+        Keycode.D,
+        Keycode.Q,
+    )
+
     # Keycode to character mapping (for password entry)
     KEYCODE_TO_CHAR = {
         # Lowercase letters
@@ -57,6 +67,19 @@ class WiFiScannerApp(App):
         Keycode.GRAVE_ACCENT: '`',
     }
 
+    # (keycode, char) pairs for the per-frame typing loop (built once, no
+    # dict view iteration or .get() default per key)
+    CHAR_KEYS = tuple(KEYCODE_TO_CHAR.items())
+
+    # Shifted characters for numbers and symbols (built once, not per keypress)
+    SHIFT_MAP = {
+        '0': ')', '1': '!', '2': '@', '3': '#', '4': '$',
+        '5': '%', '6': '^', '7': '&', '8': '*', '9': '(',
+        '-': '_', '=': '+', '[': '{', ']': '}', '\\': '|',
+        ';': ':', "'": '"', ',': '<', '.': '>', '/': '?',
+        '`': '~'
+    }
+
     # Uppercase keycodes set for fast lookup
     _UPPERCASE_KEYCODES = {
         Keycode.A_UPPER, Keycode.B_UPPER, Keycode.C_UPPER, Keycode.D_UPPER,
@@ -93,7 +116,7 @@ class WiFiScannerApp(App):
         # Pre-build list of all keycodes to check for password entry
         control_keys = [Keycode.BACKSPACE, Keycode.ENTER, Keycode.ESCAPE]
         modifier_keys = [Keycode.LEFT_SHIFT, Keycode.RIGHT_SHIFT]
-        self._all_keys_to_check = control_keys + modifier_keys + list(self.KEYCODE_TO_CHAR.keys())
+        self._all_keys_to_check = tuple(control_keys + modifier_keys + list(self.KEYCODE_TO_CHAR.keys()))
 
     def _get_saved_password(self, ssid):
         """Get saved password for an SSID, if any"""
@@ -244,14 +267,7 @@ class WiFiScannerApp(App):
 
     def _handle_network_selection(self):
         """Handle input in network selection mode"""
-        keys = self.sys.keys_pressed([
-            Keycode.UP_ARROW,
-            Keycode.DOWN_ARROW,
-            Keycode.ENTER,
-            Keycode.R,
-            Keycode.D,
-            Keycode.Q
-        ])
+        keys = self.sys.keys_pressed(self.LIST_KEYS)
 
         if keys[Keycode.UP_ARROW] and not self.scanning:
             # Scroll up
@@ -401,18 +417,11 @@ class WiFiScannerApp(App):
 
         else:
             # Check character keys
-            for keycode, char in self.KEYCODE_TO_CHAR.items():
-                if keys.get(keycode, False):
+            for keycode, char in self.CHAR_KEYS:
+                if keys[keycode]:
                     # Apply shift transformations for non-letter characters
                     if shift_pressed and keycode not in self._UPPERCASE_KEYCODES:
-                        shift_map = {
-                            '0': ')', '1': '!', '2': '@', '3': '#', '4': '$',
-                            '5': '%', '6': '^', '7': '&', '8': '*', '9': '(',
-                            '-': '_', '=': '+', '[': '{', ']': '}', '\\': '|',
-                            ';': ':', "'": '"', ',': '<', '.': '>', '/': '?',
-                            '`': '~'
-                        }
-                        char = shift_map.get(char, char)
+                        char = self.SHIFT_MAP.get(char, char)
 
                     self.password += char
                     self.need_update = True
@@ -471,42 +480,49 @@ class WiFiScannerApp(App):
                 y += 5
                 visible_networks = self.networks[self.scroll_offset:self.scroll_offset + self.lines_per_page]
 
+                # Bind per-row lookups to locals once, outside the row loop
+                draw_text = self.sys.draw_text
+                row_width = self.sys.width - 4
+                icons_x_start = self.sys.width - 15
+                bottom = self.sys.height - 60
+
                 for i, network in enumerate(visible_networks):
                     network_index = self.scroll_offset + i
                     is_selected = (network_index == self.selected_index)
 
                     # Highlight selected network
                     if is_selected:
-                        self.sys.draw_rect(2, y - 2, self.sys.width - 4, 14, (255, 255, 0))
+                        self.sys.draw_rect(2, y - 2, row_width, 14, (255, 255, 0))
                         text_color = (0, 0, 0)  # Black text on yellow
                     else:
                         text_color = (255, 255, 255)  # White text
 
                     # Draw signal strength bars
+                    # (positional args - no keyword dict per call)
                     bars = self._signal_strength_bars(network['rssi'])
-                    self.sys.draw_text(bars, 5, y, scale=1, color=text_color)
+                    draw_text(bars, 5, y, 1, text_color)
 
                     # Draw SSID (truncate if too long)
                     ssid = network['ssid']
                     if len(ssid) > 18:
                         ssid = ssid[:15] + "..."
-                    self.sys.draw_text(ssid, 35, y, scale=1, color=text_color)
+                    draw_text(ssid, 35, y, 1, text_color)
 
                     # Draw icons on the right
-                    icons_x = self.sys.width - 15
+                    icons_x = icons_x_start
                     # Draw lock icon if secured
                     if network['security_code'] != 0:
-                        self.sys.draw_text("L", icons_x, y, scale=1, color=text_color)
+                        draw_text("L", icons_x, y, 1, text_color)
                         icons_x -= 12  # Move left for next icon
 
                     # Draw star icon if we have saved password
                     if self._get_saved_password(network['ssid']):
-                        self.sys.draw_text("*", icons_x, y, scale=1, color=text_color)
+                        draw_text("*", icons_x, y, 1, text_color)
 
                     y += 14
 
                     # Stop if we run out of space
-                    if y > self.sys.height - 60:
+                    if y > bottom:
                         break
 
         # Status message
@@ -24,6 +24,16 @@ def viper(func):
     return func
 
 
+def native(func):
+    """
+    Compatibility stub for @micropython.native decorator
+
+    In MicroPython, this compiles the function's bytecode to native code.
+    In CPython, we just return the function unchanged.
+    """
+    return func
+
+
 # Type hints for viper functions - in CPython these are just ignored
 # In MicroPython viper mode, these become native pointer types
 class ptr8:
@@ -40,4 +50,4 @@ class ptr32:
 
 
 # Make everything available
-__all__ = ['const', 'viper', 'ptr8', 'ptr16', 'ptr32']
+__all__ = ['const', 'viper', 'native', 'ptr8', 'ptr16', 'ptr32']
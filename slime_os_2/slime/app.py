@@ -3,9 +3,35 @@ Slime OS 2 - App Base Class
 
 All apps inherit from this class and implement the run() method.
 The run() method should be a generator that yields control back to the OS.
+Alternatively, apps can implement tick(), which the OS calls once per frame.
 """
 
 
+# Returned from App.tick() to exit the app (return to launcher)
+EXIT = object()
+
+
+class LaunchRequest:
+    """
+    Command to launch another app.
+
+    Return (or yield) this from run() to switch apps:
+        return LaunchRequest(OtherAppClass)
+
+    The OS identifies it with a single type check, so it is cheaper to
+    dispatch than the legacy ('launch', AppClass) tuple (still supported).
+    """
+
+    __slots__ = ('app_class',)
+
+    def __init__(self, app_class):
+        """
+        Args:
+            app_class: App class to launch
+        """
+        self.app_class = app_class
+
+
 class App:
     """
     Base class for all Slime OS apps
@@ -13,6 +39,8 @@ class App:
     Apps inherit from this class and override the run() method.
     The run() method should be a generator that yields control back to the OS.
 
+    Instead of run(), apps can define tick() - see the tick attribute below.
+
     Lifecycle hooks (optional overrides):
     - on_enter(): Called when app starts, before run() is called
     - on_exit(): Called when app exits normally (return/break from run())
@@ -26,6 +54,17 @@ class App:
     name = "Unknown App"
     id = "unknown"
 
+    # Optional per-frame alternative to run(). Define as a method to use it:
+    #
+    #     def tick(self):
+    #         ...one frame of work...
+    #         return None  # Keep running (or EXIT, or LaunchRequest(AppClass))
+    #
+    # The OS calls tick() directly every frame instead of resuming a
+    # generator, so there is no generator state or StopIteration handling.
+    # Set up state in on_enter(). When tick is defined, run() is not used.
+    tick = None
+
     def __init__(self, system):
         """
         Initialize app.
@@ -132,11 +171,11 @@ class App:
         - ALWAYS yield regularly (at least every 100ms) to prevent watchdog timeout
         - Keep iterations fast (< 100ms per yield)
         - To exit app: `return` or `break` from run()
-        - To launch another app: `return ('launch', OtherAppClass)`
+        - To launch another app: `return LaunchRequest(OtherAppClass)`
 
         Yields:
             None (just yield) to continue app loop
-            ('launch', AppClass) to launch another app
+            LaunchRequest(AppClass) to launch another app
 
         Example:
             def run(self):
@@ -26,6 +26,9 @@ class PicoCalcDevice(BaseDevice):
     KEYBOARD_SCL = 7
     KEYBOARD_SDA = 6
     KEYBOARD_I2C_ID = 1
+    # Bus clock shared by keyboard and battery (same bus - each driver
+    # reinitializes it, so they must agree or the last one wins)
+    KEYBOARD_I2C_HZ = 100_000
 
     # Display (SPI)
     DISPLAY_SCK = 10
@@ -34,6 +37,7 @@ class PicoCalcDevice(BaseDevice):
     DISPLAY_DC = 14
     DISPLAY_RESET = 15
     DISPLAY_BACKLIGHT = 8
+    DISPLAY_SPI_HZ = 40_000_000  # SPI clock for framebuffer blits
 
     # SD Card (SPI) - for future use
     SD_CARD_SCK = 18
@@ -68,7 +72,8 @@ class PicoCalcDevice(BaseDevice):
             cs=self.DISPLAY_CS,
             dc=self.DISPLAY_DC,
             reset=self.DISPLAY_RESET,
-            backlight=self.DISPLAY_BACKLIGHT
+            backlight=self.DISPLAY_BACKLIGHT,
+            baudrate=self.DISPLAY_SPI_HZ
         )
 
     def create_input(self):
@@ -96,7 +101,7 @@ class PicoCalcDevice(BaseDevice):
             self.KEYBOARD_I2C_ID,
             scl=scl_pin,
             sda=sda_pin,
-            freq=100000  # 100kHz standard speed
+            freq=self.KEYBOARD_I2C_HZ
         )
 
         # Scan for keyboard
@@ -135,5 +140,6 @@ class PicoCalcDevice(BaseDevice):
             reg_percent=self.BATTERY_REG_PERCENT,
             reg_vbat_h=self.BATTERY_REG_VBAT_H,
             reg_vbat_l=self.BATTERY_REG_VBAT_L,
-            reg_charging_status=self.BATTERY_REG_CHARGING_STATUS
+            reg_charging_status=self.BATTERY_REG_CHARGING_STATUS,
+            freq=self.KEYBOARD_I2C_HZ
         )
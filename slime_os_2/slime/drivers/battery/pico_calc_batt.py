@@ -18,6 +18,7 @@ KEYBOARD_I2C_ADDRESS = 0x1F
 
 # Register IDs (from keyboard controller firmware)
 REG_ID_BAT = 0x0b  # Battery register
+_REQUEST_BAT = bytes((REG_ID_BAT,))  # Register request, built once (not per read)
 
 
 class PicoCalcBattery(AbstractBattery):
@@ -29,7 +30,8 @@ class PicoCalcBattery(AbstractBattery):
     battery data through register 0x0b.
     """
 
-    def __init__(self, i2c_id, sda, scl, i2c_address, reg_percent, reg_vbat_h, reg_vbat_l, reg_charging_status):
+    def __init__(self, i2c_id, sda, scl, i2c_address, reg_percent, reg_vbat_h, reg_vbat_l, reg_charging_status,
+                 freq):
         """
         Initialize the battery driver and I2C connection
 
@@ -42,25 +44,31 @@ class PicoCalcBattery(AbstractBattery):
             reg_vbat_h: Not used (kept for compatibility)
             reg_vbat_l: Not used (kept for compatibility)
             reg_charging_status: Not used (kept for compatibility)
+            freq: I2C bus clock in Hz (required) - must match the keyboard
+                  driver's (PicoCalcDevice.KEYBOARD_I2C_HZ), as both share
+                  the bus and creating it here reconfigures it
         """
         self.i2c_id = i2c_id
         self.sda = sda
         self.scl = scl
+        self.freq = freq
 
         self.i2c = None
         self._last_level = 0
         self._last_charging = False
+        self._response = bytearray(2)  # Reply buffer reused by every read
         self._init_i2c()
 
     def _init_i2c(self):
         """Initialize I2C connection to keyboard controller"""
         try:
             # Use the same I2C bus as keyboard with pull-ups
-            # IMPORTANT: Speed must be 10kHz to match keyboard controller
+            # IMPORTANT: Speed must match the keyboard driver's - this
+            # reconfigures the shared bus
             scl_pin = Pin(self.scl, Pin.OUT, Pin.PULL_UP)
             sda_pin = Pin(self.sda, Pin.OUT, Pin.PULL_UP)
 
-            self.i2c = I2C(self.i2c_id, scl=scl_pin, sda=sda_pin, freq=10000)
+            self.i2c = I2C(self.i2c_id, scl=scl_pin, sda=sda_pin, freq=self.freq)
 
             devices = self.i2c.scan()
             print(f"[Battery] I2C devices found: {[hex(dev) for dev in devices]}")
@@ -92,32 +100,29 @@ class PicoCalcBattery(AbstractBattery):
 
         try:
             # Write register ID to request battery data
-            self.i2c.writeto(KEYBOARD_I2C_ADDRESS, bytes([REG_ID_BAT]))
+            self.i2c.writeto(KEYBOARD_I2C_ADDRESS, _REQUEST_BAT)
 
             # Wait for keyboard controller to prepare response
             time.sleep_ms(16)
 
-            # Read 2 bytes response
-            response = self.i2c.readfrom(KEYBOARD_I2C_ADDRESS, 2)
+            # Read 2 bytes response into the reusable buffer (always filled)
+            response = self._response
+            self.i2c.readfrom_into(KEYBOARD_I2C_ADDRESS, response)
 
-            if len(response) == 2:
-                register_id = response[0]
-                battery_data = response[1]
+            register_id = response[0]
+            battery_data = response[1]
 
-                # Extract percentage (bits 0-6)
-                percent = battery_data & 0x7F
+            # Extract percentage (bits 0-6)
+            percent = battery_data & 0x7F
 
-                # Extract charging status (bit 7)
-                is_charging = (battery_data & 0x80) != 0
+            # Extract charging status (bit 7)
+            is_charging = (battery_data & 0x80) != 0
 
-                # Cache the values
-                self._last_level = percent
-                self._last_charging = is_charging
+            # Cache the values
+            self._last_level = percent
+            self._last_charging = is_charging
 
-                return percent, is_charging
-            else:
-                print(f"[Battery] Unexpected response length: {len(response)}")
-                return self._last_level, self._last_charging
+            return percent, is_charging
 
         except Exception as e:
             print(f"[Battery] Error reading battery data: {e}")
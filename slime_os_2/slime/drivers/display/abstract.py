@@ -22,6 +22,7 @@ class AbstractDisplay:
         """
         self.width = width
         self.height = height
+        self._bounds = (width, height)  # Built once - dimensions never change
 
     def get_bounds(self):
         """
@@ -30,7 +31,7 @@ class AbstractDisplay:
         Returns:
             Tuple (width, height)
         """
-        return (self.width, self.height)
+        return self._bounds
 
     def set_pen(self, r, g, b):
         """
@@ -43,6 +44,34 @@ class AbstractDisplay:
         """
         raise NotImplementedError("Subclasses must implement set_pen()")
 
+    def create_pen(self, r, g, b):
+        """
+        Pack a color into a pen value for set_pen_cached().
+
+        Drivers can override this to return their native color format
+        so that set_pen_cached() does no conversion work.
+        Default implementation packs to a 24-bit RGB integer.
+
+        Args:
+            r, g, b: Color components (0-255)
+
+        Returns:
+            Integer pen value
+        """
+        return (r << 16) | (g << 8) | b
+
+    def set_pen_cached(self, pen):
+        """
+        Set current drawing color from a value returned by create_pen().
+
+        Default implementation unpacks the 24-bit RGB integer and calls set_pen().
+        Override together with create_pen() for better performance.
+
+        Args:
+            pen: Pen value from create_pen()
+        """
+        self.set_pen((pen >> 16) & 0xFF, (pen >> 8) & 0xFF, pen & 0xFF)
+
     def rectangle(self, x, y, w, h):
         """
         Draw filled rectangle.
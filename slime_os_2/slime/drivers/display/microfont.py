@@ -48,6 +48,12 @@ class MicroFont:
         self.index = None
         self.cache = {}
         self.stream = stream # We keep the file open for lower latecy.
+        # Glyph reads go into these reusable buffers instead of allocating
+        # new bytes objects for every character drawn. The bitmap buffer
+        # fits the widest glyph (max_width, padded to whole bytes).
+        self.width_buf = bytearray(2)
+        self.ch_buf = bytearray((max_width + 7)//8 * height)
+        self.ch_view = memoryview(self.ch_buf)
 
     def __del__(self):
         """Close file handle when object is destroyed"""
@@ -99,18 +105,26 @@ class MicroFont:
         self.stream.seek(12+self.index_len+doff) # 12 is header len.
 
         # Read width header
-        width_bytes = self.stream.read(2)
+        width_bytes = self.width_buf
+        self.stream.readinto(width_bytes)
         width = self.read_int_16(width_bytes)
 
-        # Read character bitmap data
+        # Read character bitmap data into the shared glyph buffer. The
+        # returned bitmap is only valid until the next get_ch() call.
         char_data_len = (width + 7)//8 * self.height
-        char_data = self.stream.read(char_data_len)
+        if char_data_len > len(self.ch_buf):
+            # Wider than the header's max_width claims - grow to fit
+            self.ch_buf = bytearray(char_data_len)
+            self.ch_view = memoryview(self.ch_buf)
+        self.stream.readinto(self.ch_view[:char_data_len])
 
         # Return as tuple - don't cache unless explicitly enabled
-        retval = (char_data, self.height, width)
+        # (cached glyphs get their own copy of the bitmap)
         if self.cache_chars:
+            retval = (bytes(self.ch_view[:char_data_len]), self.height, width)
             self.cache[ch] = retval
-        return retval
+            return retval
+        return (self.ch_buf, self.height, width)
 
     # Lowlevel framebuffer function. That's the core of the library, as handles
     # the actual drawing of the character to the target framebuffer memory
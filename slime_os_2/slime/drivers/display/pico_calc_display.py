@@ -12,17 +12,57 @@ import framebuf
 from machine import SPI, Pin
 import gc
 
-   
+
+# Custom initialization sequence for Pico Calc's display
+# (module-level: built once at import, shared by every instance)
+_CUSTOM_INIT = [
+    (b'\x01', 100),  # Soft reset
+    # Gamma settings
+    (b'\xE0\x00\x03\x09\x08\x16\x0A\x3F\x78\x4C\x09\x0A\x08\x16\x1A\x0F',),
+    (b'\xE1\x00\x16\x19\x03\x0F\x05\x32\x45\x46\x04\x0E\x0D\x35\x37\x0F',),
+    # Power control
+    (b'\xC0\x17\x15',),
+    (b'\xC1\x41',),
+    (b'\xC5\x00\x12\x80',),
+    # Memory access control
+    (b'\x36\x48',),  # MADCTL with MX/BGR settings
+    # Interface configuration
+    (b'\x3A\x55',),  # 16-bit color
+    (b'\xB0\x00',),  # Interface mode control
+    # (b'\xB1\xA0',),  # Frame rate control (intial settings)
+    (b'\xB1\xD0\x11',), # Frame rate control 60Hz
+    # Display features
+    (b'\x21',),  # Display inversion ON
+    (b'\xB4\x02',),  # Display inversion control
+    (b'\xB6\x02\x02\x3B',),  # Display function control
+    # Additional controls
+    (b'\xB7\xC6',),
+    (b'\xE9\x00',),
+    (b'\xF7\xA9\x51\x2C\x82',),
+    # Wakeup
+    (b'\x11', 120),  # Sleep OUT
+    (b'\x29', 120),  # Display ON
+]
+
+# Custom rotations for this display
+_CUSTOM_ROTATIONS = [
+    (0x88, 320, 320, 0, 0),
+    (0xE8, 320, 320, 0, 0),
+    (0x48, 320, 320, 0, 0),
+    (0x28, 320, 320, 0, 0),
+]
+
 
 class PicoCalcDisplay(AbstractDisplay):
     """
     Pico Calc 320x320 ST7789 display driver
 
-    Uses a partial framebuffer (320x100 pixels) for better performance
-    while staying within memory constraints.
+    Draws into a full-screen RGB565 framebuffer (320x320 pixels) and sends
+    it to the panel in one burst per update, so drawing primitives never
+    touch the SPI bus.
     """
 
-    def __init__(self, width, height, sck, mosi, cs, dc, reset, backlight):
+    def __init__(self, width, height, sck, mosi, cs, dc, reset, backlight, baudrate=40_000_000):
         """
         Initialize Pico Calc display.
 
@@ -30,46 +70,10 @@ class PicoCalcDisplay(AbstractDisplay):
             width, height: Display dimensions (should be 320x320)
             sck, mosi: SPI pins
             cs, dc, reset, backlight: Display control pins
+            baudrate: SPI clock in Hz (blit time scales with this)
         """
         super().__init__(width, height)
 
-        # Custom initialization sequence for Pico Calc's display
-        custom_init = [
-            (b'\x01', 100),  # Soft reset
-            # Gamma settings
-            (b'\xE0\x00\x03\x09\x08\x16\x0A\x3F\x78\x4C\x09\x0A\x08\x16\x1A\x0F',),
-            (b'\xE1\x00\x16\x19\x03\x0F\x05\x32\x45\x46\x04\x0E\x0D\x35\x37\x0F',),
-            # Power control
-            (b'\xC0\x17\x15',),
-            (b'\xC1\x41',),
-            (b'\xC5\x00\x12\x80',),
-            # Memory access control
-            (b'\x36\x48',),  # MADCTL with MX/BGR settings
-            # Interface configuration
-            (b'\x3A\x55',),  # 16-bit color
-            (b'\xB0\x00',),  # Interface mode control
-            # (b'\xB1\xA0',),  # Frame rate control (intial settings)
-            (b'\xB1\xD0\x11',), # Frame rate control 60Hz
-            # Display features
-            (b'\x21',),  # Display inversion ON
-            (b'\xB4\x02',),  # Display inversion control
-            (b'\xB6\x02\x02\x3B',),  # Display function control
-            # Additional controls
-            (b'\xB7\xC6',),
-            (b'\xE9\x00',),
-            (b'\xF7\xA9\x51\x2C\x82',),
-            # Wakeup
-            (b'\x11', 120),  # Sleep OUT
-            (b'\x29', 120),  # Display ON
-        ]
-
-        # Custom rotations for this display
-        custom_rotations = [
-            (0x88, 320, 320, 0, 0),
-            (0xE8, 320, 320, 0, 0),
-            (0x48, 320, 320, 0, 0),
-            (0x28, 320, 320, 0, 0),
-        ]
         # Framebuffer for improved performance
         # 320x320 pixels = 204,800 bytes (200KB)
         self.fbuf_w = 320
@@ -83,7 +87,9 @@ class PicoCalcDisplay(AbstractDisplay):
         )
 
         # Initialize SPI
-        spi = SPI(1, baudrate=40_000_000, sck=Pin(sck), mosi=Pin(mosi))
+        # Mode 0, 8-bit MSB-first framing stated explicitly rather than relying on port defaults
+        spi = SPI(1, baudrate=baudrate, polarity=0, phase=0, bits=8, firstbit=SPI.MSB,
+                  sck=Pin(sck), mosi=Pin(mosi))
 
         # Initialize ST7789 driver
         self.display = st7789.ST7789(
@@ -94,8 +100,8 @@ class PicoCalcDisplay(AbstractDisplay):
             dc=Pin(dc, Pin.OUT),
             reset=Pin(reset, Pin.OUT),
             backlight=Pin(backlight, Pin.OUT),
-            custom_init=custom_init,
-            rotations=custom_rotations,
+            custom_init=_CUSTOM_INIT,
+            rotations=_CUSTOM_ROTATIONS,
             rotation=2,  # 180 degree rotation
             color_order=st7789.RGB,
             inversion=False,
@@ -112,6 +118,11 @@ class PicoCalcDisplay(AbstractDisplay):
         self.current_pen = st7789.color565(255, 255, 255)  # White
 
         self.fbuf.fill(0)  # Clear framebuffer
+
+        # Rows drawn to since the last update ([start, end), empty when start >= end).
+        # update() only sends this band of rows to the panel.
+        self._dirty_y0 = self.fbuf_h
+        self._dirty_y1 = 0
         self.text_queue = []
 
         # Construct path to font file relative to this module
@@ -129,20 +140,62 @@ class PicoCalcDisplay(AbstractDisplay):
 
     def set_pen(self, r, g, b):
         """Set drawing color"""
-        self._set_pen_fb(r,g,b)
-        self.current_pen = st7789.color565(r, g, b)
+        # Pack RGB565 inline (same as st7789.color565, without the call) once,
+        # then byte-swap it for the framebuffer
+        colour = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        self.current_pen = colour
+        self.current_pen_fb = (colour >> 8) | ((colour & 0xFF) << 8)
+
+    def create_pen(self, r, g, b):
+        """Pack color as byte-swapped RGB565, ready for framebuffer drawing"""
+        colour = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        return (colour >> 8) | ((colour & 0xFF) << 8)
+
+    def set_pen_cached(self, pen):
+        """Set drawing color from a pen created by create_pen()"""
+        self.current_pen_fb = pen
+
+    # Primitives call the framebuffer's native (C) methods directly - no
+    # extra Python call frame per primitive - and widen the dirty row band
+    # inline (clamped to the framebuffer when blitting)
 
     def rectangle(self, x, y, w, h):
-        """Draw filled rectangle"""
-        self._rectangle_fb(x,y,w,h)
+        """Draw filled rectangle to framebuffer"""
+        self.fbuf.rect(x, y, w, h, self.current_pen_fb, 1)
+        if y < self._dirty_y0:
+            self._dirty_y0 = y
+        if y + h > self._dirty_y1:
+            self._dirty_y1 = y + h
 
     def pixel(self, x, y):
-        """Draw single pixel"""
-        self._pixel_fb(x,y)
+        """Draw pixel to framebuffer"""
+        self.fbuf.pixel(x, y, self.current_pen_fb)
+        if y < self._dirty_y0:
+            self._dirty_y0 = y
+        if y >= self._dirty_y1:
+            self._dirty_y1 = y + 1
 
     def line(self, x1, y1, x2, y2):
-        """Draw line"""
-        self._line_fb(x1,y1,x2,y2)
+        """Draw line to framebuffer"""
+        if y1 < y2:
+            top, bottom = y1, y2
+        else:
+            top, bottom = y2, y1
+        if top < self._dirty_y0:
+            self._dirty_y0 = top
+        if bottom >= self._dirty_y1:
+            self._dirty_y1 = bottom + 1
+
+        # Axis-aligned lines (separators, borders) go through the span fill
+        # instead of the per-pixel Bresenham walk
+        if y1 == y2:
+            if x2 < x1:
+                x1, x2 = x2, x1
+            self.fbuf.hline(x1, y1, x2 - x1 + 1, self.current_pen_fb)
+        elif x1 == x2:
+            self.fbuf.vline(x1, top, bottom - top + 1, self.current_pen_fb)
+        else:
+            self.fbuf.line(x1, y1, x2, y2, self.current_pen_fb)
 
     def text(self, text, x, y, scale=1):
         """Draw text"""
@@ -151,7 +204,15 @@ class PicoCalcDisplay(AbstractDisplay):
             choosen_font = 0
         else:
             choosen_font = scale - 1
-        self.fonts[choosen_font].write(text, self.fbuf, self.fb_colour, self.fbuf_w, self.fbuf_h, x, y, self.current_pen_fb, rot=0, x_spacing=0, y_spacing=0)
+        font = self.fonts[choosen_font]
+        # Positional args only - rot/spacing keep their defaults (no per-call kwargs)
+        font.write(text, self.fbuf, self.fb_colour, self.fbuf_w, self.fbuf_h, x, y, self.current_pen_fb)
+        if y < self._dirty_y0:
+            self._dirty_y0 = y
+        # Embedded newlines render extra lines below - dirty to the bottom
+        bottom = self.fbuf_h if '\n' in text else y + font.height
+        if bottom > self._dirty_y1:
+            self._dirty_y1 = bottom
         # self._queue_text(text, x, y, self.current_pen, scale)
 
     def measure_text(self, text, scale=1):
@@ -166,10 +227,18 @@ class PicoCalcDisplay(AbstractDisplay):
         """
         Update display - blit framebuffer to screen.
 
-        Note: Currently drawing directly to display, so this is a no-op.
-        Framebuffer methods (below) can be used for improved performance.
+        All drawing goes to the framebuffer, so the frame is sent as a
+        single blit_buffer() transfer (one window set + one SPI write).
+        Only the band of rows drawn to since the last update is sent -
+        rows are contiguous in the framebuffer, so the band is a
+        memoryview slice with no copy. Nothing is sent if nothing was drawn.
         """
-        self._blit_framebuffer()
+        y0 = max(self._dirty_y0, 0)
+        y1 = min(self._dirty_y1, self.fbuf_h)
+        self._dirty_y0 = self.fbuf_h
+        self._dirty_y1 = 0
+        if y0 < y1:
+            self._blit_framebuffer_partial(0, y0, self.fbuf_w, y1 - y0)
 
     def update_partial(self, x, y, w, h):
         """
@@ -181,14 +250,25 @@ class PicoCalcDisplay(AbstractDisplay):
         """
         self._blit_framebuffer_partial(x, y, w, h)
 
+        # A full-width region at the top of the dirty band (the toolbar) has
+        # now been sent - drop those rows so update() doesn't resend them
+        if x <= 0 and x + w >= self.fbuf_w and y <= self._dirty_y0 < y + h:
+            if y + h >= self._dirty_y1:
+                self._dirty_y0 = self.fbuf_h  # Band fully sent - now empty
+                self._dirty_y1 = 0
+            else:
+                self._dirty_y0 = y + h
+
     def reset(self):
         """
         Reset display state - clear framebuffer and text queue.
 
         This ensures a clean state for app transitions.
         """
-        # Clear framebuffer to black
+        # Clear framebuffer to black (whole screen must be resent)
         self.fbuf.fill(0)
+        self._dirty_y0 = 0
+        self._dirty_y1 = self.fbuf_h
 
         # Clear text queue
         # self.text_queue.clear()
@@ -203,24 +283,6 @@ class PicoCalcDisplay(AbstractDisplay):
         print(f"Queued text: {text}, {x}, {y}, {color}, {scale}")
         print(f"Remaining ram: {gc.mem_free()}")
 
-    def _set_pen_fb(self, r, g, b):
-        """Set pen color for framebuffer drawing"""
-        msb_colour = st7789.color565(r, g, b)
-        lsb_colour = (msb_colour >> 8) | ((msb_colour & 0xFF) << 8)
-        self.current_pen_fb = lsb_colour
-
-    def _rectangle_fb(self, x, y, w, h):
-        """Draw filled rectangle to framebuffer"""
-        self.fbuf.rect(x, y, w, h, self.current_pen_fb, 1)
-
-    def _pixel_fb(self, x, y):
-        """Draw pixel to framebuffer"""
-        self.fbuf.pixel(x, y, self.current_pen_fb)
-
-    def _line_fb(self, x1, y1, x2, y2):
-        """Draw line to framebuffer"""
-        self.fbuf.line(x1, y1, x2, y2, self.current_pen_fb)
-
     def _blit_framebuffer(self, x=0, y=0):
         """Blit framebuffer to display at position"""
         return self.display.blit_buffer(self.fbuf, x, y, self.fbuf_w, self.fbuf_h)
@@ -229,7 +291,10 @@ class PicoCalcDisplay(AbstractDisplay):
         """
         Blit only a specific region of the framebuffer to display.
 
-        Creates a temporary framebuffer view of the region and blits it.
+        Full-width regions (e.g. the toolbar) are contiguous in the
+        framebuffer, so they are sent straight from a memoryview slice
+        without copying. Other regions are copied row by row into a
+        temporary buffer first.
 
         Args:
             x, y: Top-left corner of region
@@ -247,13 +312,17 @@ class PicoCalcDisplay(AbstractDisplay):
         # Calculate byte offset in framebuffer (RGB565 = 2 bytes per pixel)
         bytes_per_row = self.fbuf_w * 2
         offset = (y * bytes_per_row) + (x * 2)
+        src_buf = memoryview(self.fbuf)
+
+        # Full-width region: rows are contiguous, blit in one burst with no copy
+        if w == self.fbuf_w:
+            return self.display.blit_buffer(src_buf[offset:offset + h * bytes_per_row], x, y, w, h)
 
         # Create a framebuffer view of the region
         # For RGB565, we need to extract the rectangular region
         region_buf = bytearray(w * h * 2)
 
         # Copy rows from main framebuffer to region buffer
-        src_buf = memoryview(self.fbuf)
         for row in range(h):
             src_offset = offset + (row * bytes_per_row)
             dst_offset = row * w * 2
@@ -39,3 +39,22 @@ class AbstractInput:
             Dict mapping each keycode to True/False
         """
         raise NotImplementedError("Subclasses must implement get_keys()")
+
+    def get_keys_into(self, keycodes, result, case_sensitive=False):
+        """
+        Check multiple keys at once, writing into an existing dict.
+
+        Lets callers reuse one dict across frames instead of allocating a
+        new one per call. Default implementation copies get_keys() results;
+        override to fill `result` directly.
+
+        Args:
+            keycodes: List of keycode constants
+            result: Dict to write keycode -> True/False entries into
+            case_sensitive: Same as get_keys()
+
+        Returns:
+            The `result` dict
+        """
+        result.update(self.get_keys(keycodes, case_sensitive=case_sensitive))
+        return result
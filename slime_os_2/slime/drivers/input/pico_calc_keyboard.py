@@ -8,9 +8,19 @@ Protocol: 16-bit value with action code (press/release) and key code
 from .abstract import AbstractInput
 
 from lib.keycode import Keycode
+from micropython import const
+import micropython
 import time
 
 
+# Protocol constants used on every poll - const() folds them into the
+# bytecode instead of a class attribute lookup per use
+_KEYBOARD_ADDR = const(31)  # I2C address of keyboard controller
+_ACTION_PRESS = const(1)
+_ACTION_RELEASE = const(3)
+_REQUEST_KEY = b'\x09'  # Read key event register
+
+
 class PicoCalcKeyboard(AbstractInput):
     """
     Pico Calc I2C keyboard driver
@@ -162,11 +172,11 @@ class PicoCalcKeyboard(AbstractInput):
     }
 
     # I2C address of keyboard controller
-    KEYBOARD_ADDR = 31
+    KEYBOARD_ADDR = _KEYBOARD_ADDR
 
     # Action codes from keyboard protocol
-    ACTION_PRESS = 1
-    ACTION_RELEASE = 3
+    ACTION_PRESS = _ACTION_PRESS
+    ACTION_RELEASE = _ACTION_RELEASE
 
     def __init__(self, i2c):
         """
@@ -190,9 +200,9 @@ class PicoCalcKeyboard(AbstractInput):
             except Exception as e:
                 print(f"[PicoCalcKeyboard] WARNING: I2C bus test failed: {e}")
 
-        # Create inverse map: keycode -> raw_code
-        self.inv_map = {v: k for k, v in self.KEY_MAP.items()}
-        
+        # Inverse map (keycode -> raw_code) is built on first use - see inv_map
+        self._inv_map = None
+
         # Map standard keycodes to their upper/lower variants for caps-independent checking
         self._letter_variants = {
             Keycode.A: (Keycode.A, Keycode.A_UPPER),
@@ -223,10 +233,24 @@ class PicoCalcKeyboard(AbstractInput):
             Keycode.Z: (Keycode.Z, Keycode.Z_UPPER),
         }
 
-        # Track held keys
-        self.held = {}
-        for raw_code in self.KEY_MAP:
-            self.held[raw_code] = False
+        # Precompute keycode -> raw codes to check, so key lookups never go
+        # through inv_map or the letter variant table at runtime. A keycode
+        # can come from several raw codes (e.g. joystick and arrow keys).
+        raw_codes = {}
+        for raw_code, keycode in self.KEY_MAP.items():
+            raw_codes[keycode] = raw_codes.get(keycode, ()) + (raw_code,)
+        self._raw_codes_exact = raw_codes
+        # Case-insensitive letters check both upper and lower variants
+        self._raw_codes = dict(raw_codes)
+        for keycode, (lower_keycode, upper_keycode) in self._letter_variants.items():
+            self._raw_codes[keycode] = raw_codes.get(lower_keycode, ()) + raw_codes.get(upper_keycode, ())
+        self._shift_raw_codes = raw_codes.get(Keycode.LEFT_SHIFT, ()) + raw_codes.get(Keycode.RIGHT_SHIFT, ())
+        self._caps_lock_raw_codes = raw_codes.get(Keycode.CAPS_LOCK, ())
+
+        # Track held keys - one byte per raw code (key codes are 8-bit), so
+        # polling is an array load rather than a dict lookup
+        self.held = bytearray(256)
+        self._no_keys = bytes(256)  # Template for clearing held in place
 
         # Timeout tracking
         self.last_key_time = 0
@@ -239,10 +263,34 @@ class PicoCalcKeyboard(AbstractInput):
         self.shift_active = False
         self.caps_lock_active = False
 
+        # Reply buffer reused by every poll
+        self._i2c_buf = bytearray(2)
+
+    @property
+    def inv_map(self):
+        """
+        Get the inverse key map: keycode -> raw code.
+
+        Only diagnostics use this (key lookups go through the precomputed
+        raw code tuples), so it isn't kept on the heap from boot.
+
+        Returns:
+            Dict of keycode -> raw code, built once on first access
+        """
+        if self._inv_map is None:
+            self._inv_map = {v: k for k, v in self.KEY_MAP.items()}
+        return self._inv_map
+
     def _read_raw_data(self):
         """
         Read raw data from keyboard controller.
 
+        The request and its reply are always completed in one call - the
+        controller at this address also serves battery and backlight
+        requests from other drivers, so a request left pending between
+        frames could be answered with one of their replies and the key
+        event popped from the controller's FIFO would be lost.
+
         Returns:
             Raw key code (positive for press, negative for release, 0 for no event)
         """
@@ -256,11 +304,13 @@ class PicoCalcKeyboard(AbstractInput):
 
         try:
             # Request data from keyboard
-            self.i2c.writeto(self.KEYBOARD_ADDR, b'\x09')
+            self.i2c.writeto(_KEYBOARD_ADDR, _REQUEST_KEY)
             time.sleep_ms(4)  # Give controller time to respond
 
-            # Read 2 bytes
-            data = self.i2c.readfrom(self.KEYBOARD_ADDR, 2)
+            # Read 2 bytes into the reusable buffer (no allocation per poll)
+            data = self._i2c_buf
+            self.i2c.readfrom_into(_KEYBOARD_ADDR, data)
+
             value = (data[1] << 8) | data[0]  # Combine into 16-bit value
 
             # Reset error count on successful read
@@ -275,9 +325,9 @@ class PicoCalcKeyboard(AbstractInput):
             action_code = value & 0xFF
             key_code = value >> 8
 
-            if action_code == self.ACTION_PRESS:
+            if action_code == _ACTION_PRESS:
                 return key_code  # Positive = press
-            elif action_code == self.ACTION_RELEASE:
+            elif action_code == _ACTION_RELEASE:
                 return -key_code  # Negative = release
 
             return 0
@@ -305,13 +355,12 @@ class PicoCalcKeyboard(AbstractInput):
     def _update_key_state(self):
         """Update internal key state from hardware"""
         raw_code = self._read_raw_data()
-        # Modifier tracking
-        if raw_code in (self.inv_map.get(Keycode.LEFT_SHIFT),
-                        self.inv_map.get(Keycode.RIGHT_SHIFT)):
+        # Modifier tracking (press sets, release clears)
+        if abs(raw_code) in self._shift_raw_codes:
             self.shift_active = (raw_code > 0)
 
         # Caps lock toggle (only on key press, not release)
-        if raw_code > 0 and raw_code == self.inv_map.get(Keycode.CAPS_LOCK):
+        if raw_code > 0 and raw_code in self._caps_lock_raw_codes:
             self.caps_lock_active = not self.caps_lock_active
 
         if raw_code == 0:
@@ -319,8 +368,7 @@ class PicoCalcKeyboard(AbstractInput):
             if self.last_key_time != 0:
                 if time.ticks_diff(time.ticks_ms(), self.last_key_time) > self.key_timeout_ms:
                     # Timeout - clear all held keys
-                    for key in self.held:
-                        self.held[key] = False
+                    self.held[:] = self._no_keys
                     self.last_key_time = 0
         else:
             # Got event
@@ -328,13 +376,10 @@ class PicoCalcKeyboard(AbstractInput):
 
             if raw_code < 0:
                 # Key release
-                raw_code = -raw_code
-                if raw_code in self.held:
-                    self.held[raw_code] = False
+                self.held[-raw_code] = 0
             else:
                 # Key press
-                if raw_code in self.held:
-                    self.held[raw_code] = True
+                self.held[raw_code] = 1
 
     def get_key(self, keycode, case_sensitive=False):
         """
@@ -349,25 +394,12 @@ class PicoCalcKeyboard(AbstractInput):
             True if pressed, False otherwise
         """
         # Read from cached state (updated once per frame by system)
-        # If case_sensitive is False and this is a letter keycode, check both variants
-        if not case_sensitive and keycode in self._letter_variants:
-            lower_keycode, upper_keycode = self._letter_variants[keycode]
-            # Check both variants
-            lower_raw = self.inv_map.get(lower_keycode, None)
-            upper_raw = self.inv_map.get(upper_keycode, None)
-            
-            lower_pressed = lower_raw is not None and self.held.get(lower_raw, False)
-            upper_pressed = upper_raw is not None and self.held.get(upper_raw, False)
-            
-            return lower_pressed or upper_pressed
-
-        # Look up raw code for this keycode (case-sensitive or non-letter)
-        raw_code = self.inv_map.get(keycode, None)
-        if raw_code is None:
-            return False  # Unknown keycode
-
-        # Return held state
-        return self.held.get(raw_code, False)
+        raw_codes = self._raw_codes_exact if case_sensitive else self._raw_codes
+        held = self.held
+        for raw_code in raw_codes.get(keycode, ()):
+            if held[raw_code]:
+                return True
+        return False
 
     def get_keys(self, keycodes, case_sensitive=False):
         """
@@ -381,26 +413,32 @@ class PicoCalcKeyboard(AbstractInput):
         Returns:
             Dict mapping each keycode to True/False
         """
-        # Read from cached state (updated once per frame by system)
-        result = {}
-        for keycode in keycodes:
-            # Check each keycode from cached state
-            if not case_sensitive and keycode in self._letter_variants:
-                # Case-insensitive letter: check both upper and lower variants
-                lower_keycode, upper_keycode = self._letter_variants[keycode]
-                lower_raw = self.inv_map.get(lower_keycode, None)
-                upper_raw = self.inv_map.get(upper_keycode, None)
+        return self.get_keys_into(keycodes, {}, case_sensitive=case_sensitive)
 
-                lower_pressed = lower_raw is not None and self.held.get(lower_raw, False)
-                upper_pressed = upper_raw is not None and self.held.get(upper_raw, False)
+    # Runs for every polled key of every frame - compiled to native code
+    # to skip the bytecode dispatch in the nested loop
+    @micropython.native
+    def get_keys_into(self, keycodes, result, case_sensitive=False):
+        """
+        Check multiple keys at once, writing into an existing dict.
 
-                result[keycode] = lower_pressed or upper_pressed
-            else:
-                # Case-sensitive or non-letter: check exact keycode
-                raw_code = self.inv_map.get(keycode, None)
-                if raw_code is None:
-                    result[keycode] = False  # Unknown keycode
-                else:
-                    result[keycode] = self.held.get(raw_code, False)
+        Args:
+            keycodes: List of keycode constants
+            result: Dict to write keycode -> True/False entries into
+            case_sensitive: Same as get_keys()
+
+        Returns:
+            The `result` dict
+        """
+        # Read from cached state (updated once per frame by system)
+        raw_codes = self._raw_codes_exact if case_sensitive else self._raw_codes
+        held = self.held
+        for keycode in keycodes:
+            pressed = False
+            for raw_code in raw_codes.get(keycode, ()):
+                if held[raw_code]:
+                    pressed = True
+                    break
+            result[keycode] = pressed
 
         return result
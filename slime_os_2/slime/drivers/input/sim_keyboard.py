@@ -108,6 +108,9 @@ class SimKeyboard(AbstractInput):
         # Track keys that were pressed last frame (for edge detection)
         self.prev_pressed_keys = set()
 
+        # Keys newly pressed this frame (snapshot taken once per frame)
+        self.just_pressed = set()
+
         # Modifier states
         self.caps_lock_active = False
 
@@ -117,31 +120,55 @@ class SimKeyboard(AbstractInput):
         """Clear all pressed keys (useful when launching new app)"""
         self.pressed_keys.clear()
         self.prev_pressed_keys.clear()
+        self.just_pressed.clear()
 
     def _update_key_state(self):
         """Update keyboard state from pygame"""
         # Process all pending events
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                # Key pressed
-                if event.key in self.KEY_MAP:
-                    keycode = self.KEY_MAP[event.key]
-                    self.pressed_keys.add(keycode)
+        # Map lookup and held set bound once, not re-resolved per event
+        map_key = self.KEY_MAP.get
+        pressed_keys = self.pressed_keys
+        events = pygame.event.get()
+        for event in events:
+            event_type = event.type
+            if event_type == pygame.KEYDOWN:
+                # Key pressed (single lookup instead of `in` + index)
+                keycode = map_key(event.key)
+                if keycode is not None:
+                    pressed_keys.add(keycode)
 
                     # Toggle caps lock on press
                     if keycode == Keycode.CAPS_LOCK:
                         self.caps_lock_active = not self.caps_lock_active
 
-            elif event.type == pygame.KEYUP:
+            elif event_type == pygame.KEYUP:
                 # Key released
-                if event.key in self.KEY_MAP:
-                    keycode = self.KEY_MAP[event.key]
-                    self.pressed_keys.discard(keycode)
+                keycode = map_key(event.key)
+                if keycode is not None:
+                    pressed_keys.discard(keycode)
 
-            elif event.type == pygame.QUIT:
+            elif event_type == pygame.QUIT:
                 # Window closed
                 raise SystemExit("Window closed")
 
+        # Idle fast path: with no events since the last frame the held set
+        # still equals last frame's snapshot, so there can be no new presses
+        just_pressed = self.just_pressed
+        if not events:
+            if just_pressed:
+                just_pressed.clear()
+            return
+
+        # Snapshot edges once per frame so every get_key/get_keys call in
+        # the frame sees the same presses (and none of them copy key sets)
+        prev_pressed_keys = self.prev_pressed_keys
+        just_pressed.clear()
+        for keycode in pressed_keys:
+            if keycode not in prev_pressed_keys:
+                just_pressed.add(keycode)
+        prev_pressed_keys.clear()
+        prev_pressed_keys.update(pressed_keys)
+
     def get_key(self, keycode, case_sensitive=False):
         """
         Check if a specific key was just pressed (edge detection).
@@ -154,13 +181,7 @@ class SimKeyboard(AbstractInput):
             True if pressed this frame (not last frame), False otherwise
         """
         # Read from cached state (updated once per frame by system)
-        # Check if key is newly pressed (pressed now, but not last frame)
-        is_newly_pressed = keycode in self.pressed_keys and keycode not in self.prev_pressed_keys
-
-        # Update previous state for next frame
-        self.prev_pressed_keys = self.pressed_keys.copy()
-
-        return is_newly_pressed
+        return keycode in self.just_pressed
 
     def get_keys(self, keycodes, case_sensitive=False):
         """
@@ -173,13 +194,23 @@ class SimKeyboard(AbstractInput):
         Returns:
             Dict mapping each keycode to True/False (True if newly pressed)
         """
+        return self.get_keys_into(keycodes, {}, case_sensitive=case_sensitive)
+
+    def get_keys_into(self, keycodes, result, case_sensitive=False):
+        """
+        Check multiple keys at once (edge detection), writing into an existing dict.
+
+        Args:
+            keycodes: List of keycode constants
+            result: Dict to write keycode -> True/False entries into
+            case_sensitive: Ignored for simulator (always case-sensitive)
+
+        Returns:
+            The `result` dict
+        """
         # Read from cached state (updated once per frame by system)
-        # Check each key for new presses
-        result = {}
+        just_pressed = self.just_pressed
         for keycode in keycodes:
-            result[keycode] = keycode in self.pressed_keys and keycode not in self.prev_pressed_keys
-
-        # Update previous state for next frame
-        self.prev_pressed_keys = self.pressed_keys.copy()
+            result[keycode] = keycode in just_pressed
 
         return result
@@ -11,33 +11,66 @@ class Logger:
     """
     Simple logger for OS and apps
 
-    Stores recent log messages in a circular buffer.
+    Stores recent log messages in a preallocated circular buffer.
     Can also print to stdout (useful for simulator).
+
+    Messages below the current level are dropped. Callers building
+    expensive debug strings can check `debug_enabled` first to skip
+    the formatting entirely.
     """
 
-    def __init__(self, max_messages=100, print_to_stdout=False):
+    # Log levels (lowest to highest)
+    DEBUG = 0
+    INFO = 1
+    WARN = 2
+    ERROR = 3
+
+    def __init__(self, max_messages=100, print_to_stdout=False, level=DEBUG):
         """
         Initialize logger.
 
         Args:
             max_messages: Maximum number of messages to keep
             print_to_stdout: If True, also print messages to stdout
+            level: Minimum level to record (Logger.DEBUG, INFO, WARN or ERROR)
         """
         self.max_messages = max_messages
         self.print_to_stdout = print_to_stdout
-        self.messages = []  # List of (timestamp, level, message) tuples
+        self.set_level(level)
+
+        # Preallocated ring buffer of (timestamp, level, message) tuples.
+        # Fixed size, so logging never grows or shifts a list on the heap.
+        self._buffer = [None] * max_messages
+        self._head = 0  # Index of the next slot to write
+        self.count = 0  # Number of messages currently stored
+        self.total = 0  # Messages logged since start (changes on every log call)
+
+    def set_level(self, level):
+        """
+        Set minimum level to record.
+
+        Args:
+            level: Logger.DEBUG, Logger.INFO, Logger.WARN or Logger.ERROR
+        """
+        self.level = level
+        self.debug_enabled = level <= Logger.DEBUG
+
+    @property
+    def messages(self):
+        """All stored messages, oldest first (builds a new list - prefer count/total for polling)"""
+        return self.get_all()
 
     def _log(self, level, message):
         """Internal log method"""
         timestamp = time.time()
         entry = (timestamp, level, str(message))
 
-        # Add to buffer
-        self.messages.append(entry)
-
-        # Trim if too many
-        if len(self.messages) > self.max_messages:
-            self.messages.pop(0)
+        # Overwrite oldest slot in the ring buffer
+        self._buffer[self._head] = entry
+        self._head = (self._head + 1) % self.max_messages
+        if self.count < self.max_messages:
+            self.count += 1
+        self.total += 1
 
         # Print if enabled
         if self.print_to_stdout:
@@ -45,15 +78,18 @@ class Logger:
 
     def debug(self, message):
         """Log debug message"""
-        self._log("DEBUG", message)
+        if self.debug_enabled:
+            self._log("DEBUG", message)
 
     def info(self, message):
         """Log info message"""
-        self._log("INFO", message)
+        if self.level <= Logger.INFO:
+            self._log("INFO", message)
 
     def warn(self, message):
         """Log warning message"""
-        self._log("WARN", message)
+        if self.level <= Logger.WARN:
+            self._log("WARN", message)
 
     def error(self, message):
         """Log error message"""
@@ -67,17 +103,23 @@ class Logger:
             count: Number of recent messages to return
 
         Returns:
-            List of (timestamp, level, message) tuples
+            List of (timestamp, level, message) tuples, oldest first
         """
-        return self.messages[-count:]
+        count = min(count, self.count)
+        start = self._head - count
+        size = self.max_messages
+        return [self._buffer[(start + i) % size] for i in range(count)]
 
     def get_all(self):
         """Get all log messages"""
-        return self.messages.copy()
+        return self.get_recent(self.count)
 
     def clear(self):
         """Clear all log messages"""
-        self.messages.clear()
+        for i in range(self.max_messages):
+            self._buffer[i] = None
+        self._head = 0
+        self.count = 0
 
     def format_message(self, entry):
         """
@@ -63,8 +63,11 @@ class Settings:
             True on success, False on error
         """
         try:
+            # Serialize first, then write in one call - json.dump() to the
+            # file issues a small write per token, each one a flash/SD access
+            data = json.dumps(self.settings)
             with open(self.SETTINGS_FILE, 'w') as f:
-                json.dump(self.settings, f)
+                f.write(data)
             print(f"[Settings] Saved to {self.SETTINGS_FILE}")
             return True
         except Exception as e:
@@ -11,34 +11,76 @@ The System class is the OS kernel that manages:
 
 import time
 import gc as _gc_module
+from array import array
 from slime.logger import Logger
 from slime.settings import Settings
+from slime.app import LaunchRequest, EXIT
 
 # Create gc wrapper that works for both MicroPython and Python
+# The MicroPython-vs-Python split is resolved once here, not on every call
 class GC:
     """GC wrapper for MicroPython/Python compatibility"""
 
     def collect(self):
         return _gc_module.collect()
 
-    def mem_free(self):
-        # MicroPython has this, standard Python doesn't
-        if hasattr(_gc_module, 'mem_free'):
+    # MicroPython has these, standard Python doesn't
+    if hasattr(_gc_module, 'mem_free'):
+        def mem_free(self):
             return _gc_module.mem_free()
-        else:
+
+        def mem_alloc(self):
+            return _gc_module.mem_alloc()
+    else:
+        def mem_free(self):
             # Simulator: return fake value
             return 200_000  # ~200KB free
 
-    def mem_alloc(self):
-        # MicroPython has this, standard Python doesn't
-        if hasattr(_gc_module, 'mem_alloc'):
-            return _gc_module.mem_alloc()
-        else:
+        def mem_alloc(self):
             # Simulator: return fake value
             return 64_000  # ~64KB allocated
 
+    # MicroPython only: run a collection after `amount` bytes are allocated
+    if hasattr(_gc_module, 'threshold'):
+        def threshold(self, amount):
+            _gc_module.threshold(amount)
+    else:
+        def threshold(self, amount):
+            pass
+
 gc = GC()
 
+# Millisecond/microsecond tick counters (MicroPython has these, standard Python doesn't)
+try:
+    from time import ticks_ms, ticks_us, ticks_diff, ticks_add, sleep_ms
+except ImportError:
+    # Simulator: emulate MicroPython's 30-bit wrapping ticks
+    _TICKS_MAX = 0x3FFFFFFF
+    _TICKS_HALF = 0x20000000
+
+    # Monotonic source, so wall-clock adjustments don't disturb frame pacing
+    _monotonic = time.monotonic
+
+    def ticks_ms():
+        return int(_monotonic() * 1000) & _TICKS_MAX
+
+    def ticks_us():
+        return int(_monotonic() * 1_000_000) & _TICKS_MAX
+
+    def ticks_diff(end, start):
+        return ((end - start + _TICKS_HALF) & _TICKS_MAX) - _TICKS_HALF
+
+    def ticks_add(ticks, delta):
+        return (ticks + delta) & _TICKS_MAX
+
+    def sleep_ms(ms):
+        time.sleep(ms / 1000)
+
+
+# Frame result for "app keeps running" - the common case of every frame,
+# returned as one shared tuple instead of building a new one each frame
+_FRAME_CONTINUE = (True, None, None)
+
 
 class System:
     """
@@ -52,6 +94,16 @@ class System:
     TOOLBAR_HEIGHT = 16
     TOOLBAR_ENABLED = True
 
+    # Frame rate cap (frame period precomputed as integer microseconds)
+    TARGET_FPS = 30
+    FRAME_TIME_US = 1_000_000 // TARGET_FPS  # 33333us
+
+    # Maximum number of RGB tuple -> pen conversions kept by _pen()
+    PEN_CACHE_SIZE = 64
+
+    # Number of recent frames used for the FPS average (~2 seconds at 30 FPS)
+    FPS_WINDOW = 60
+
     # Keyboard controller I2C address (for backlight control)
     KEYBOARD_I2C_ADDRESS = 0x1F
     KEYBOARD_REG_LCD_BACKLIGHT = 0x05  # LCD backlight register
@@ -68,28 +120,73 @@ class System:
         """
         self.device = device
 
+        # Display dimensions are fixed - read once instead of via self.device
+        self._w = device.display_width
+        self._h_full = device.display_height
+
         # Lazy-loaded drivers
         self._display = None
         self._input = None
         self._battery = None
 
+        # Reused memory_info() result (avoids a new dict per call)
+        self._mem_info = {'free': 0, 'allocated': 0, 'total': 0, 'percent_used': 0}
+        # Heap size never changes - measured once so memory_info() only
+        # needs mem_free() (each gc.mem_* call walks the whole heap table)
+        self._heap_total = gc.mem_free() + gc.mem_alloc()
+
+        # Pens for RGB tuples passed to draw calls (see _pen())
+        self._pen_cache = {}
+
+        # Bound display driver methods (set when display driver is loaded)
+        self._set_pen_cached = None
+        self._rect = None
+        self._text = None
+        self._line = None
+        self._pixel = None
+
+        # Bound input driver methods (set when input driver is loaded)
+        self._get_key = None
+        self._get_keys_into = None
+        self._keys_scratch = {}  # Reused keys_pressed() result (avoids a new dict per frame)
+
         # Toolbar state
+        self._y_offset = self.TOOLBAR_HEIGHT if self.TOOLBAR_ENABLED else 0  # App area offset for draw calls
+        self._h = self._h_full - self._y_offset  # App area height (fixed once the toolbar is decided)
         self._toolbar_frame = 0
         self._toolbar_update_interval = 30  # Update toolbar every 30 frames (~1 second at 30fps)
         self._last_mem_free = 0  # Will be initialized on first update
         self._last_fps = 0
-        self._fps_frame_times = []  # Track last N frame times for FPS calculation
+        self._fps_frame_times = array('i', [0] * self.FPS_WINDOW)  # Ring buffer of frame ticks (ms)
+        self._fps_idx = 0  # Next write position in _fps_frame_times
+        self._fps_filled = 0  # Number of valid entries in _fps_frame_times
         self._toolbar_update_count = 0  # Counter for toolbar updates
-        self._last_cpu_freq = 0  # CPU frequency in MHz
+        self._last_cpu_freq = self.get_cpu_frequency()  # CPU frequency in MHz (refreshed by set_cpu_frequency)
         self._last_battery_level = 0  # Battery percentage
         self._last_battery_charging = False  # Is battery charging
         self._last_wifi_connected = False  # WiFi connection status
+        self._wifi_auto_connecting = False  # Boot auto-connect not yet reported
+        self._last_caps_lock = False  # Caps lock state shown on toolbar
+        self._toolbar_dirty = True  # Toolbar needs repainting
+        self._toolbar_stats_text = None  # Cached toolbar strings/positions (built by _update_toolbar_data)
+        self._toolbar_mem_kb = -1  # RAM value behind the cached label
+        self._toolbar_mem_text = ""  # Cached RAM label, e.g. "180KB"
+        self._toolbar_cpu_mhz = -1  # CPU value behind the cached label
+        self._toolbar_cpu_text = ""  # Cached CPU label, e.g. "150MHz"
 
         # Logger (print to stdout for simulator)
         print_logs = (device.name == "Simulator")
-        self.log = Logger(max_messages=200, print_to_stdout=print_logs)
+        # Debug messages are only recorded in the simulator, so hardware doesn't
+        # pay for formatting lifecycle chatter on every app switch
+        log_level = Logger.DEBUG if print_logs else Logger.INFO
+        self.log = Logger(max_messages=200, print_to_stdout=print_logs, level=log_level)
         self.log.info(f"System initializing on {device.name}")
 
+        # GC policy: let allocation volume trigger collections (half-heap
+        # watermark) instead of forcing collects on hot paths
+        gc.collect()
+        gc.threshold(gc.mem_free() // 2)
+
         # Settings manager (must be after logger)
         self.settings = Settings()
         self._wlan = None  # WiFi interface (lazy loaded)
@@ -105,6 +202,9 @@ class System:
             except ImportError:
                 self.log.warn("Watchdog not available on this platform")
 
+        # Bind the per-frame feed once (no-op when watchdog is disabled)
+        self._wdt_feed = self.wdt.feed if self.wdt else (lambda: None)
+
     # ========================================================================
     # Display API
     # ========================================================================
@@ -114,31 +214,99 @@ class System:
         """Get display driver (lazy loaded)"""
         if self._display is None:
             self._display = self.device.create_display()
-            print(f"[OS] Display initialized: {self.device.display_width}x{self.device.display_height}")
+            print(f"[OS] Display initialized: {self._w}x{self._h_full}")
+            self._bind_display()
         return self._display
 
+    def _bind_display(self):
+        """
+        Bind hot display methods and precompute system pens.
+
+        Called once when the display driver is loaded, so draw calls skip
+        the display property and method lookups.
+        """
+        display = self._display
+
+        # Bound drawing methods (used by every app every frame)
+        self._set_pen_cached = display.set_pen_cached
+        self._rect = display.rectangle
+        self._text = display.text
+        self._line = display.line
+        self._pixel = display.pixel
+
+        # Pens for colors used by the OS itself (toolbar, clear)
+        self._pen_black = display.create_pen(0, 0, 0)
+        self._pen_toolbar_bg = display.create_pen(32, 32, 32)
+        self._pen_yellow = display.create_pen(255, 255, 0)
+        self._pen_green = display.create_pen(0, 255, 0)
+        self._pen_red = display.create_pen(255, 0, 0)
+        self._pen_cyan = display.create_pen(0, 255, 255)
+        self._pen_gray = display.create_pen(100, 100, 100)
+        self._pen_white = display.create_pen(255, 255, 255)
+
+        # FPS color lookup indexed by min(fps, 28): slow < 20 <= OK < 28 <= good
+        self._fps_pens = (self._pen_red,) * 20 + (self._pen_yellow,) * 8 + (self._pen_green,)
+
     @property
     def width(self):
         """Get display width"""
-        return self.device.display_width
+        return self._w
 
     @property
     def height(self):
         """Get display height (excluding toolbar if enabled)"""
-        if self.TOOLBAR_ENABLED:
-            return self.device.display_height - self.TOOLBAR_HEIGHT
-        return self.device.display_height
+        return self._h
+
+    def make_pen(self, r, g, b):
+        """
+        Precompute a pen for a color.
+
+        Pens can be passed anywhere a color is accepted and skip the
+        per-call RGB conversion. Create them once (e.g. in on_enter) and reuse.
+
+        Args:
+            r, g, b: Color components (0-255)
+
+        Returns:
+            Integer pen value
+        """
+        return self.display.create_pen(r, g, b)
+
+    def _pen(self, color):
+        """
+        Get the pen for a color argument.
+
+        RGB tuples are converted once and cached, so apps passing the same
+        tuple every frame don't pay for the conversion on each draw call.
+
+        Args:
+            color: RGB tuple (r, g, b) or pen from make_pen()
+
+        Returns:
+            Integer pen value
+        """
+        if isinstance(color, int):
+            return color
+        pen = self._pen_cache.get(color)
+        if pen is None:
+            # Bound the cache so apps animating colors can't grow it forever
+            if len(self._pen_cache) >= self.PEN_CACHE_SIZE:
+                self._pen_cache.clear()
+            pen = self._display.create_pen(*color)
+            self._pen_cache[color] = pen
+        return pen
 
     def clear(self, color=(0, 0, 0)):
         """
         Clear screen to color (app area only, not toolbar).
 
         Args:
-            color: RGB tuple (r, g, b)
+            color: RGB tuple (r, g, b) or pen from make_pen()
         """
-        self.display.set_pen(*color)
-        y_offset = self.TOOLBAR_HEIGHT if self.TOOLBAR_ENABLED else 0
-        self.display.rectangle(0, y_offset, self.width, self.height)
+        if self._rect is None:
+            self.display  # Lazy-load display driver (binds drawing methods)
+        self._set_pen_cached(self._pen(color))
+        self._rect(0, self._y_offset, self._w, self._h)
 
     def draw_rect(self, x, y, w, h, color):
         """
@@ -147,11 +315,12 @@ class System:
         Args:
             x, y: Position (relative to app area)
             w, h: Size
-            color: RGB tuple (r, g, b)
+            color: RGB tuple (r, g, b) or pen from make_pen()
         """
-        y_offset = self.TOOLBAR_HEIGHT if self.TOOLBAR_ENABLED else 0
-        self.display.set_pen(*color)
-        self.display.rectangle(x, y + y_offset, w, h)
+        if self._rect is None:
+            self.display  # Lazy-load display driver (binds drawing methods)
+        self._set_pen_cached(self._pen(color))
+        self._rect(x, y + self._y_offset, w, h)
 
     def draw_text(self, text, x, y, scale=1, color=(255, 255, 255)):
         """
@@ -161,11 +330,12 @@ class System:
             text: String to draw
             x, y: Position (relative to app area)
             scale: Text scale (1, 2, 3, etc.)
-            color: RGB tuple (r, g, b)
+            color: RGB tuple (r, g, b) or pen from make_pen()
         """
-        y_offset = self.TOOLBAR_HEIGHT if self.TOOLBAR_ENABLED else 0
-        self.display.set_pen(*color)
-        self.display.text(text, x, y + y_offset, scale=scale)
+        if self._rect is None:
+            self.display  # Lazy-load display driver (binds drawing methods)
+        self._set_pen_cached(self._pen(color))
+        self._text(text, x, y + self._y_offset, scale)
 
     def draw_line(self, x1, y1, x2, y2, color):
         """
@@ -174,11 +344,13 @@ class System:
         Args:
             x1, y1: Start position (relative to app area)
             x2, y2: End position (relative to app area)
-            color: RGB tuple (r, g, b)
+            color: RGB tuple (r, g, b) or pen from make_pen()
         """
-        y_offset = self.TOOLBAR_HEIGHT if self.TOOLBAR_ENABLED else 0
-        self.display.set_pen(*color)
-        self.display.line(x1, y1 + y_offset, x2, y2 + y_offset)
+        if self._rect is None:
+            self.display  # Lazy-load display driver (binds drawing methods)
+        self._set_pen_cached(self._pen(color))
+        y_offset = self._y_offset
+        self._line(x1, y1 + y_offset, x2, y2 + y_offset)
 
     def draw_pixel(self, x, y, color):
         """
@@ -186,11 +358,51 @@ class System:
 
         Args:
             x, y: Position (relative to app area)
-            color: RGB tuple (r, g, b)
+            color: RGB tuple (r, g, b) or pen from make_pen()
+        """
+        if self._rect is None:
+            self.display  # Lazy-load display driver (binds drawing methods)
+        self._set_pen_cached(self._pen(color))
+        self._pixel(x, y + self._y_offset)
+
+    def draw_rects(self, rects, color):
+        """
+        Draw several filled rectangles in one color.
+
+        Sets the pen once for the whole batch - cheaper than calling
+        draw_rect() per rectangle when drawing grids or tables.
+
+        Args:
+            rects: Iterable of (x, y, w, h) tuples (relative to app area)
+            color: RGB tuple (r, g, b) or pen from make_pen()
+        """
+        if self._rect is None:
+            self.display  # Lazy-load display driver (binds drawing methods)
+        self._set_pen_cached(self._pen(color))
+        rect = self._rect
+        y_offset = self._y_offset
+        for x, y, w, h in rects:
+            rect(x, y + y_offset, w, h)
+
+    def draw_texts(self, texts, scale=1, color=(255, 255, 255)):
+        """
+        Draw several strings in one color.
+
+        Sets the pen once for the whole batch - cheaper than calling
+        draw_text() per string when drawing grids or tables.
+
+        Args:
+            texts: Iterable of (text, x, y) tuples (relative to app area)
+            scale: Text scale (1, 2, 3, etc.)
+            color: RGB tuple (r, g, b) or pen from make_pen()
         """
-        y_offset = self.TOOLBAR_HEIGHT if self.TOOLBAR_ENABLED else 0
-        self.display.set_pen(*color)
-        self.display.pixel(x, y + y_offset)
+        if self._rect is None:
+            self.display  # Lazy-load display driver (binds drawing methods)
+        self._set_pen_cached(self._pen(color))
+        draw = self._text
+        y_offset = self._y_offset
+        for text, x, y in texts:
+            draw(text, x, y + y_offset, scale)
 
     def measure_text(self, text, scale=1):
         """
@@ -211,7 +423,7 @@ class System:
 
         Called by apps after drawing each frame.
         """
-        if full_update:
+        if full_update and self._toolbar_dirty:
             self._draw_toolbar()
         # Flip display buffer to screen
         self.display.update()
@@ -231,12 +443,13 @@ class System:
 
         Note: The toolbar area is also cleared and will be redrawn on next update().
         """
-        self.display.reset()
+        self.display.reset()  # Also binds drawing methods on first use
 
         # Clear toolbar area explicitly
         if self.TOOLBAR_ENABLED:
-            self.display.set_pen(0, 0, 0)
-            self.display.rectangle(0, 0, self.device.display_width, self.TOOLBAR_HEIGHT)
+            self._set_pen_cached(self._pen_black)
+            self._rect(0, 0, self._w, self.TOOLBAR_HEIGHT)
+            self._toolbar_dirty = True
 
     # ========================================================================
     # Input API
@@ -249,6 +462,10 @@ class System:
             self._input = self.device.create_input()
             print("[OS] Input initialized")
 
+            # Bind hot input methods once (used by every app every frame)
+            self._get_key = self._input.get_key
+            self._get_keys_into = self._input.get_keys_into
+
             # Apply brightness settings now that input driver (with I2C bus) is ready
             if self.device.name == "Pico Calc":
                 display_brightness = self.settings.get('display_brightness', 255)
@@ -271,21 +488,30 @@ class System:
         Returns:
             True if pressed, False otherwise
         """
-        return self.input.get_key(keycode, case_sensitive=case_sensitive)
+        if self._get_key is None:
+            self.input  # Lazy-load input driver (binds _get_key)
+        return self._get_key(keycode, case_sensitive)
 
     def keys_pressed(self, keycodes, case_sensitive=False):
         """
         Check multiple keys at once.
 
         Args:
-            keycodes: List of keycode constants
+            keycodes: Tuple or list of keycode constants. For per-frame polling,
+                      pass a tuple constant defined once (e.g. a class attribute)
+                      rather than building a new list every frame.
             case_sensitive: If True, only check exact keycodes. If False (default),
                           for letter keycodes, check both upper and lower variants.
 
         Returns:
-            Dict mapping each keycode to True/False
+            Dict mapping each keycode to True/False. The same dict is reused
+            on every call, so read it before the next keys_pressed() call.
         """
-        return self.input.get_keys(keycodes, case_sensitive=case_sensitive)
+        if self._get_keys_into is None:
+            self.input  # Lazy-load input driver (binds _get_keys_into)
+        keys = self._keys_scratch
+        keys.clear()
+        return self._get_keys_into(keycodes, keys, case_sensitive)
 
     # ========================================================================
     # Battery API
@@ -325,21 +551,22 @@ class System:
     # WiFi API
     # ========================================================================
 
-    def wifi_connect(self, ssid=None, password=None, timeout=10):
+    def wifi_connect_start(self, ssid=None, password=None):
         """
-        Connect to WiFi network
+        Start connecting to WiFi network without waiting for the link.
+
+        The connection completes in the background; wifi_status() (and the
+        toolbar's WiFi indicator) reports it once it is up.
 
         Args:
             ssid: Network SSID (uses settings if None)
             password: Network password (uses settings if None)
-            timeout: Connection timeout in seconds
 
         Returns:
-            Tuple of (success: bool, ip_address: str or None, error: str or None)
+            Tuple of (started: bool, error: str or None)
         """
         try:
             import network
-            import time
 
             # Use credentials from settings if not provided
             if ssid is None:
@@ -348,7 +575,7 @@ class System:
                 password = self.settings.get('wifi_password', '')
 
             if not ssid:
-                return (False, None, "No SSID configured")
+                return (False, "No SSID configured")
 
             self.log.info(f"WiFi: Connecting to '{ssid}'...")
 
@@ -359,14 +586,42 @@ class System:
             # Activate and connect
             self._wlan.active(True)
             self._wlan.connect(ssid, password)
+            return (True, None)
+
+        except ImportError:
+            error = "WiFi not available (no network module)"
+            self.log.error(f"WiFi: {error}")
+            return (False, error)
+        except Exception as e:
+            error = str(e)
+            self.log.error(f"WiFi: Connection failed: {error}")
+            return (False, error)
+
+    def wifi_connect(self, ssid=None, password=None, timeout=10):
+        """
+        Connect to WiFi network, waiting until the link is up
 
+        Args:
+            ssid: Network SSID (uses settings if None)
+            password: Network password (uses settings if None)
+            timeout: Connection timeout in seconds
+
+        Returns:
+            Tuple of (success: bool, ip_address: str or None, error: str or None)
+        """
+        started, error = self.wifi_connect_start(ssid, password)
+        if not started:
+            return (False, None, error)
+
+        try:
             # Wait for connection
-            start_time = time.time()
+            deadline = ticks_add(ticks_ms(), int(timeout * 1000))
             while not self._wlan.isconnected():
-                if time.time() - start_time > timeout:
+                if ticks_diff(deadline, ticks_ms()) <= 0:
                     self.log.error(f"WiFi: Connection timeout after {timeout}s")
                     return (False, None, "Connection timeout")
-                time.sleep(0.1)
+                self._wdt_feed()  # Connection can take longer than the watchdog timeout
+                sleep_ms(100)
 
             # Get IP address
             ip_info = self._wlan.ifconfig()
@@ -375,10 +630,6 @@ class System:
             self.log.info(f"WiFi: Connected! IP: {ip_address}")
             return (True, ip_address, None)
 
-        except ImportError:
-            error = "WiFi not available (no network module)"
-            self.log.error(f"WiFi: {error}")
-            return (False, None, error)
         except Exception as e:
             error = str(e)
             self.log.error(f"WiFi: Connection failed: {error}")
@@ -455,10 +706,12 @@ class System:
             ssid = self.settings.get('wifi_ssid', '')
             if ssid:
                 self.log.info(f"WiFi: Auto-connecting to '{ssid}'...")
-                # Connect in background (non-blocking)
-                success, ip, error = self.wifi_connect(timeout=10)
-                if success:
-                    self.log.info(f"WiFi: Auto-connect successful, IP: {ip}")
+                # Connect in background - boot carries on instead of blocking
+                # for up to the connect timeout; the toolbar status refresh
+                # logs the result once the link comes up
+                started, error = self.wifi_connect_start()
+                if started:
+                    self._wifi_auto_connecting = True
                 else:
                     self.log.warn(f"WiFi: Auto-connect failed: {error}")
 
@@ -480,6 +733,7 @@ class System:
             import machine
             freq_hz = freq_mhz * 1_000_000
             machine.freq(freq_hz)
+            self._last_cpu_freq = machine.freq() // 1_000_000  # Keep toolbar value current
             if not silent:
                 self.log.info(f"CPU frequency set to {freq_mhz} MHz")
             return True
@@ -539,7 +793,7 @@ class System:
                 i2c.writeto(self.KEYBOARD_I2C_ADDRESS, msg)
 
                 # Wait for controller to process
-                time.sleep(0.016)  # 16ms
+                sleep_ms(16)
 
                 # Read response (2 bytes)
                 response = i2c.readfrom(self.KEYBOARD_I2C_ADDRESS, 2)
@@ -593,7 +847,7 @@ class System:
                 i2c.writeto(self.KEYBOARD_I2C_ADDRESS, msg)
 
                 # Wait for controller to process
-                time.sleep(0.016)  # 16ms
+                sleep_ms(16)
 
                 # Read response (2 bytes)
                 response = i2c.readfrom(self.KEYBOARD_I2C_ADDRESS, 2)
@@ -614,30 +868,39 @@ class System:
     # System Utilities
     # ========================================================================
 
-    def memory_info(self):
+    def memory_info(self, collect=False):
         """
         Get memory usage information.
 
+        Args:
+            collect: If True, run gc.collect() first for an accurate reading.
+                     Off by default - a full collection can take several ms
+                     and this is called periodically by the toolbar.
+
         Returns:
-            Dict with keys: 'free', 'allocated', 'total', 'percent_used'
+            Dict with keys: 'free', 'allocated', 'total', 'percent_used' (int %).
+            The same dict is reused on every call - copy it if you need to
+            keep values across calls.
         """
-        gc.collect()
+        if collect:
+            gc.collect()
         free = gc.mem_free()
-        allocated = gc.mem_alloc()
-        total = free + allocated
-        percent_used = (allocated / total * 100) if total > 0 else 0
-
-        return {
-            'free': free,
-            'allocated': allocated,
-            'total': total,
-            'percent_used': percent_used
-        }
+        total = self._heap_total
+        allocated = total - free
+        # Integer percentage - RP2040 has no FPU, float math is software-emulated
+        percent_used = (allocated * 100 // total) if total > 0 else 0
+
+        mem = self._mem_info
+        mem['free'] = free
+        mem['allocated'] = allocated
+        mem['total'] = total
+        mem['percent_used'] = percent_used
+        return mem
 
     def print_memory(self, label=""):
         """Print memory info with a label (for debugging)"""
-        mem = self.memory_info()
-        print(f"[MEM {label}] Free: {mem['free']:,} | Allocated: {mem['allocated']:,} | {mem['percent_used']:.1f}% used")
+        mem = self.memory_info(collect=True)
+        print(f"[MEM {label}] Free: {mem['free']:,} | Allocated: {mem['allocated']:,} | {mem['percent_used']}% used")
 
     # ========================================================================
     # Toolbar
@@ -648,88 +911,51 @@ class System:
         Draw the system toolbar at the top of the screen.
 
         Layout: SLIME OS W [CAPS] | FPS | CPU MHz | RAM KB | #counter | Battery%
+
+        Strings, positions and colors are prepared by _update_toolbar_data(),
+        so this only replays cached values to the display.
         """
         if not self.TOOLBAR_ENABLED:
             return
 
-        # Draw toolbar background (dark gray)
-        self.display.set_pen(32, 32, 32)
-        self.display.rectangle(0, 0, self.device.display_width, self.TOOLBAR_HEIGHT)
-
-        # Update data if not initialized yet
-        if self._last_mem_free == 0:
+        # Build cached data if not initialized yet
+        if self._toolbar_stats_text is None:
             self._update_toolbar_data()
 
+        set_pen_cached = self._set_pen_cached
+        text = self._text
+
+        # Draw toolbar background (dark gray)
+        set_pen_cached(self._pen_toolbar_bg)
+        self._rect(0, 0, self._w, self.TOOLBAR_HEIGHT)
+
         # Left: SLIME OS logo (yellow)
-        self.display.set_pen(255, 255, 0)  # Yellow
-        self.display.text("SLIME OS", 2, 2, scale=1)
+        set_pen_cached(self._pen_yellow)
+        text("SLIME OS", 2, 2, 1)
 
         # WiFi status icon (after SLIME OS logo)
-        wifi_icon = "W"
-        if self._last_wifi_connected:
-            wifi_color = (0, 255, 0)  # Green - connected
-        else:
-            wifi_color = (100, 100, 100)  # Gray - disconnected
-        self.display.set_pen(*wifi_color)
-        self.display.text(wifi_icon, 52, 2, scale=1)
+        set_pen_cached(self._toolbar_wifi_pen)
+        text("W", 52, 2, 1)
 
         # Caps lock indicator (after WiFi icon)
-        if self._input and hasattr(self._input, 'caps_lock_active') and self._input.caps_lock_active:
-            self.display.set_pen(255, 255, 0)  # Yellow - caps on
-            self.display.text("[CAPS]", 62, 2, scale=1)
+        if self._last_caps_lock:
+            set_pen_cached(self._pen_yellow)  # Yellow - caps on
+            text("[CAPS]", 62, 2, 1)
 
         # Right: Battery percentage (if available)
-        if self.device.has_battery:
-            # Show battery with icon
-            battery_char = "+" if self._last_battery_charging else ""
-            battery_text = f"{battery_char}{self._last_battery_level}%"
-            battery_width = self.display.measure_text(battery_text, scale=1)
-            battery_x = self.device.display_width - battery_width - 2
-
-            # Color battery based on level
-            if self._last_battery_charging:
-                battery_color = (0, 255, 255)  # Cyan - charging
-            elif self._last_battery_level >= 50:
-                battery_color = (0, 255, 0)  # Green - good
-            elif self._last_battery_level >= 20:
-                battery_color = (255, 255, 0)  # Yellow - medium
-            else:
-                battery_color = (255, 0, 0)  # Red - low
-
-            self.display.set_pen(*battery_color)
-            self.display.text(battery_text, battery_x, 2, scale=1)
-
-            # Stats go before battery
-            right_edge = battery_x - 4  # Leave gap before battery
-        else:
-            # No battery, stats go all the way to right
-            right_edge = self.device.display_width - 2
+        if self._toolbar_battery_text is not None:
+            set_pen_cached(self._toolbar_battery_pen)
+            text(self._toolbar_battery_text, self._toolbar_battery_x, 2, 1)
 
         # Middle-Right: CPU | RAM | #counter
-        cpu_text = f"{self._last_cpu_freq}MHz"
-        mem_kb = self._last_mem_free // 1024
-        update_counter = self._toolbar_update_count
-        stats_text = f"{cpu_text} | {mem_kb}KB | #{update_counter}"
-        stats_width = self.display.measure_text(stats_text, scale=1)
-        stats_x = right_edge - stats_width
-        self.display.set_pen(0, 255, 0)  # Green
-        self.display.text(stats_text, stats_x, 2, scale=1)
+        set_pen_cached(self._pen_green)
+        text(self._toolbar_stats_text, self._toolbar_stats_x, 2, 1)
 
         # Middle: FPS (before stats)
-        fps_text = f"{self._last_fps}FPS |"
-        fps_width = self.display.measure_text(fps_text, scale=1)
-        fps_x = stats_x - fps_width - 1
-
-        # Color FPS based on performance
-        if self._last_fps >= 28:
-            fps_color = (0, 255, 0)  # Green - good
-        elif self._last_fps >= 20:
-            fps_color = (255, 255, 0)  # Yellow - ok
-        else:
-            fps_color = (255, 0, 0)  # Red - slow
+        set_pen_cached(self._toolbar_fps_pen)
+        text(self._toolbar_fps_text, self._toolbar_fps_x, 2, 1)
 
-        self.display.set_pen(*fps_color)
-        self.display.text(fps_text, fps_x, 2, scale=1)
+        self._toolbar_dirty = False
 
     def _update_toolbar_data(self):
         """Update toolbar data (called periodically, not every frame)"""
@@ -740,13 +966,7 @@ class System:
         mem = self.memory_info()
         self._last_mem_free = mem['free']
 
-        # Update CPU frequency
-        try:
-            import machine
-            freq_hz = machine.freq()
-            self._last_cpu_freq = freq_hz // 1_000_000  # Convert to MHz
-        except:
-            self._last_cpu_freq = 0  # Not available
+        # CPU frequency is cached - it only changes through set_cpu_frequency()
 
         # Update battery info
         if self.device.has_battery:
@@ -761,22 +981,98 @@ class System:
         try:
             wifi_info = self.wifi_status()
             self._last_wifi_connected = wifi_info['connected']
+            if self._wifi_auto_connecting and wifi_info['connected']:
+                self._wifi_auto_connecting = False
+                self.log.info(f"WiFi: Auto-connect successful, IP: {wifi_info['ip']}")
         except:
             self._last_wifi_connected = False
 
         # Calculate FPS from recent frame times
-        if len(self._fps_frame_times) >= 2:
+        if self._fps_filled >= 2:
             # Average time between frames over last N frames
-            total_time = self._fps_frame_times[-1] - self._fps_frame_times[0]
-            num_frames = len(self._fps_frame_times) - 1
-            if total_time > 0:
-                avg_fps = num_frames / total_time
-                self._last_fps = int(avg_fps)
+            last = (self._fps_idx - 1) % self.FPS_WINDOW
+            oldest = self._fps_idx if self._fps_filled == self.FPS_WINDOW else 0
+            total_ms = ticks_diff(self._fps_frame_times[last], self._fps_frame_times[oldest])
+            num_frames = self._fps_filled - 1
+            if total_ms > 0:
+                self._last_fps = num_frames * 1000 // total_ms
             else:
                 self._last_fps = 0
         else:
             self._last_fps = 0
 
+        # The #counter shown in the toolbar changes on every update, so the
+        # strings are always rebuilt here (but only here, not per frame)
+        self._build_toolbar_cache()
+        self._toolbar_dirty = True
+
+    def _build_toolbar_cache(self):
+        """
+        Format toolbar strings and compute their positions.
+
+        Called only when toolbar data changes, so _draw_toolbar() never
+        formats or measures text itself.
+        """
+        display = self.display  # Also ensures drawing methods and system pens are bound
+
+        # WiFi status color
+        if self._last_wifi_connected:
+            self._toolbar_wifi_pen = self._pen_green  # Connected
+        else:
+            self._toolbar_wifi_pen = self._pen_gray  # Disconnected
+
+        # Right: Battery percentage (if available)
+        if self.device.has_battery:
+            # Show battery with icon
+            battery_char = "+" if self._last_battery_charging else ""
+            battery_text = f"{battery_char}{self._last_battery_level}%"
+            battery_width = display.measure_text(battery_text, scale=1)
+            battery_x = self._w - battery_width - 2
+
+            # Color battery based on level
+            if self._last_battery_charging:
+                battery_pen = self._pen_cyan  # Charging
+            elif self._last_battery_level >= 50:
+                battery_pen = self._pen_green  # Good
+            elif self._last_battery_level >= 20:
+                battery_pen = self._pen_yellow  # Medium
+            else:
+                battery_pen = self._pen_red  # Low
+
+            self._toolbar_battery_text = battery_text
+            self._toolbar_battery_x = battery_x
+            self._toolbar_battery_pen = battery_pen
+
+            # Stats go before battery
+            right_edge = battery_x - 4  # Leave gap before battery
+        else:
+            # No battery, stats go all the way to right
+            self._toolbar_battery_text = None
+            right_edge = self._w - 2
+
+        # Middle-Right: CPU | RAM | #counter
+        # CPU and RAM labels are only re-formatted when their value changes
+        if self._last_cpu_freq != self._toolbar_cpu_mhz:
+            self._toolbar_cpu_mhz = self._last_cpu_freq
+            self._toolbar_cpu_text = str(self._last_cpu_freq) + "MHz"
+        mem_kb = self._last_mem_free // 1024
+        if mem_kb != self._toolbar_mem_kb:
+            self._toolbar_mem_kb = mem_kb
+            self._toolbar_mem_text = str(mem_kb) + "KB"
+        stats_text = f"{self._toolbar_cpu_text} | {self._toolbar_mem_text} | #{self._toolbar_update_count}"
+        stats_width = display.measure_text(stats_text, scale=1)
+        self._toolbar_stats_text = stats_text
+        self._toolbar_stats_x = right_edge - stats_width
+
+        # Middle: FPS (before stats)
+        fps_text = f"{self._last_fps}FPS |"
+        fps_width = display.measure_text(fps_text, scale=1)
+        self._toolbar_fps_text = fps_text
+        self._toolbar_fps_x = self._toolbar_stats_x - fps_width - 1
+
+        # Color FPS based on performance (table lookup, see _bind_display)
+        self._toolbar_fps_pen = self._fps_pens[min(self._last_fps, 28)]
+
     def update_toolbar(self):
         """
         Update only the toolbar region of the display.
@@ -785,16 +1081,17 @@ class System:
         redraws and updates the toolbar area.
 
         Call this when you want to refresh the toolbar without updating
-        the rest of the screen.
+        the rest of the screen. The OS calls it only when the toolbar is dirty.
         """
         if not self.TOOLBAR_ENABLED:
             return
 
-        # Redraw toolbar
-        self._draw_toolbar()
+        # Redraw toolbar (only if its contents changed)
+        if self._toolbar_dirty:
+            self._draw_toolbar()
 
         # Update only the toolbar region
-        self.display.update_partial(0, 0, self.device.display_width, self.TOOLBAR_HEIGHT)
+        self.display.update_partial(0, 0, self._w, self.TOOLBAR_HEIGHT)
 
     # ========================================================================
     # App Lifecycle Management
@@ -816,21 +1113,28 @@ class System:
         if self._input is not None and hasattr(self._input, '_update_key_state'):
             self._input._update_key_state()
 
-        # Track frame times for FPS calculation
-        current_time = time.time()
-        self._fps_frame_times.append(current_time)
+            # Caps lock indicator changes independently of periodic toolbar data
+            caps_lock = getattr(self._input, 'caps_lock_active', False)
+            if caps_lock != self._last_caps_lock:
+                self._last_caps_lock = caps_lock
+                self._toolbar_dirty = True
 
-        # Keep only last 30 frame times (~1 second at 30 FPS)
-        if len(self._fps_frame_times) > 60:
-            self._fps_frame_times.pop(0)
+        # Track frame times for FPS calculation (fixed-size ring buffer, no allocation)
+        idx = self._fps_idx
+        self._fps_frame_times[idx] = ticks_ms()
+        self._fps_idx = (idx + 1) % self.FPS_WINDOW
+        if self._fps_filled < self.FPS_WINDOW:
+            self._fps_filled += 1
 
         # Update toolbar data periodically (not every frame)
         self._toolbar_frame += 1
         if self._toolbar_frame >= self._toolbar_update_interval:
             self._update_toolbar_data()
-            self._draw_toolbar()
             self._toolbar_frame = 0
-        self.update_toolbar()
+
+        # Repaint and flush the toolbar region only when its contents changed
+        if self._toolbar_dirty:
+            self.update_toolbar()
 
     def _prepare_app_for_launch(self):
         """
@@ -841,10 +1145,49 @@ class System:
         if self._input:
             try:
                 self._input.clear_state()
-                time.sleep(0.05)  # Small delay to ensure key release is processed
+                sleep_ms(50)  # Small delay to ensure key release is processed
             except AttributeError:
                 pass  # Hardware keyboards may not have clear_state
 
+    def _pace_frame(self, frame_state):
+        """
+        Wait for the next frame slot and feed the watchdog.
+
+        Called at the start of every frame, before the app runs.
+
+        Args:
+            frame_state: Dict with 'last_frame_time' key (ticks_us value)
+        """
+        # FRAME RATE LIMITING - Cap at max 30 FPS, but don't force it
+        #    This allows slow hardware to run at natural speed
+        #    Only sleep if we're running faster than target
+        #    Integer microsecond ticks avoid float allocations every frame
+        min_frame_time = self.FRAME_TIME_US  # 33333us minimum between frames
+
+        frame_start = frame_state['last_frame_time']
+        now = ticks_us()
+        elapsed = ticks_diff(now, frame_start)
+
+        # Only wait if we finished early (running too fast)
+        if elapsed < min_frame_time:
+            remaining = min_frame_time - elapsed
+            # Sleep for the bulk - short sleeps are coarse and can overshoot
+            if remaining > 3000:
+                sleep_ms(remaining // 1000 - 2)
+            # Spin for the last couple of ms to hit the frame deadline precisely
+            deadline = ticks_add(frame_start, min_frame_time)
+            while ticks_diff(deadline, ticks_us()) > 0:
+                pass
+            # Next frame is timed from the deadline, not from when the wait
+            # ended, so wake-up latency doesn't accumulate as drift
+            frame_state['last_frame_time'] = deadline
+        else:
+            # Running late - restart timing from now instead of bursting to catch up
+            frame_state['last_frame_time'] = now
+
+        # FEED WATCHDOG - Prevent hardware reset
+        self._wdt_feed()
+
     def _run_app_frame(self, app_generator, frame_state):
         """
         Run a single frame of the app.
@@ -857,7 +1200,7 @@ class System:
 
         Args:
             app_generator: The app's generator (from app.run())
-            frame_state: Dict with 'last_frame_time' key
+            frame_state: Dict with 'last_frame_time' key (ticks_us value)
 
         Returns:
             Tuple of (continue_running, exit_reason, next_app_class)
@@ -865,27 +1208,8 @@ class System:
             - exit_reason: 'normal', 'launch', etc. (only valid if continue_running=False)
             - next_app_class: Class to launch next (only valid if exit_reason='launch')
         """
-        # 1. FRAME RATE LIMITING - Cap at max 30 FPS, but don't force it
-        #    This allows slow hardware to run at natural speed
-        #    Only sleep if we're running faster than target
-        target_fps = 30
-        min_frame_time = 1.0 / target_fps  # 33ms minimum between frames
-
-        current_time = time.time()
-        elapsed = current_time - frame_state['last_frame_time']
-
-        # Only sleep if we finished early (running too fast)
-        if elapsed < min_frame_time:
-            sleep_time = min_frame_time - elapsed
-            # Only sleep if significant time remains (avoid tiny sleeps)
-            if sleep_time > 0.001:  # 1ms threshold
-                time.sleep(sleep_time)
-
-        frame_state['last_frame_time'] = time.time()
-
-        # 2. FEED WATCHDOG - Prevent hardware reset
-        if self.wdt:
-            self.wdt.feed()
+        # 1-2. FRAME RATE LIMITING + FEED WATCHDOG
+        self._pace_frame(frame_state)
 
         # 3. RUN APP - Call generator, app executes until next yield
         #    The app does its work (update state, draw UI, check input)
@@ -894,11 +1218,11 @@ class System:
             result = next(app_generator)
         except StopIteration as e:
             # App's run() function returned - app wants to exit
-            if hasattr(e, 'value') and e.value:
-                result = e.value
+            if hasattr(e, 'value') and e.value is not None:
                 # Check if app wants to launch another app
-                if isinstance(result, tuple) and result[0] == 'launch':
-                    return (False, 'launch', result[1])
+                next_app = self._get_launch_target(e.value)
+                if next_app is not None:
+                    return (False, 'launch', next_app)
             # Normal exit - return to launcher
             return (False, 'normal', None)
 
@@ -908,13 +1232,79 @@ class System:
         self._run_system_tasks()
 
         # 5. HANDLE APP RESULT - Check if app yielded a command
-        if result and isinstance(result, tuple):
-            if result[0] == 'launch':
+        #    Plain `yield` (None) is the common case and skips all checks
+        if result is not None:
+            next_app = self._get_launch_target(result)
+            if next_app is not None:
                 # App yielded a launch command
-                return (False, 'launch', result[1])
+                return (False, 'launch', next_app)
 
         # App yielded normally - continue running
-        return (True, None, None)
+        return _FRAME_CONTINUE
+
+    def _run_tick_frame(self, tick, frame_state):
+        """
+        Run a single frame of an app that uses the tick() protocol.
+
+        Same as _run_app_frame(), but calls app.tick() directly instead of
+        resuming a generator.
+
+        Args:
+            tick: The app's bound tick() method
+            frame_state: Dict with 'last_frame_time' key (ticks_us value)
+
+        Returns:
+            Tuple of (continue_running, exit_reason, next_app_class),
+            as for _run_app_frame()
+        """
+        self._pace_frame(frame_state)
+
+        # RUN APP - one frame of work
+        result = tick()
+
+        # RUN SYSTEM TASKS
+        self._run_system_tasks()
+
+        # HANDLE APP RESULT - None (keep running) is the common case
+        if result is not None:
+            if result is EXIT:
+                return (False, 'normal', None)
+            next_app = self._get_launch_target(result)
+            if next_app is not None:
+                return (False, 'launch', next_app)
+
+        return _FRAME_CONTINUE
+
+    def _get_launch_target(self, result):
+        """
+        Get the app class an app asked to launch.
+
+        Args:
+            result: Value yielded/returned by the app
+
+        Returns:
+            App class to launch, or None if result is not a launch command
+        """
+        if type(result) is LaunchRequest:
+            return result.app_class
+        # Legacy form: ('launch', AppClass)
+        if isinstance(result, tuple) and len(result) == 2 and result[0] == 'launch':
+            return result[1]
+        return None
+
+    def _call_app_hook(self, hook, hook_name, *args, **kwargs):
+        """
+        Call an app lifecycle hook, logging (not raising) any exception.
+
+        Args:
+            hook: Bound hook method (e.g. app.on_enter)
+            hook_name: Hook name for the error log
+            *args, **kwargs: Passed through to the hook
+        """
+        try:
+            hook(*args, **kwargs)
+        except Exception as e:
+            self.log.error(f"Error in {hook_name}: {e}")
 
     def _cleanup_app(self, app, app_generator):
         """
@@ -933,14 +1323,20 @@ class System:
             except:
                 pass
 
-        # Delete references and free memory
-        del app
-        del app_generator
-        gc.collect()
+    def _reclaim_app_memory(self):
+        """
+        Reclaim an exited app's memory and log memory status.
 
-        # Log memory status
-        mem = self.memory_info()
-        self.log.debug(f"Memory: {mem['free']/1024:.1f}KB free, {mem['percent_used']:.1f}% used")
+        Called by boot() after it has dropped its own references to the
+        app, its generator and its frame target - deleting this method's
+        locals would not release anything while the caller still holds them.
+        """
+        # Collect the app's garbage only if the heap is running low - otherwise
+        # the allocation threshold set at boot collects it on demand, and
+        # quick app switches don't pay for a full stop-the-world pass
+        mem = self.memory_info(collect=gc.mem_free() < self._heap_total // 4)
+        if self.log.debug_enabled:
+            self.log.debug(f"Memory: {mem['free'] // 1024}KB free, {mem['percent_used']}% used")
 
     def boot(self, initial_app_class):
         """
@@ -957,16 +1353,25 @@ class System:
         """
         current_app_class = initial_app_class
 
-        self.log.info(f"Booting {self.device.name}")
-        self.log.info(f"Starting {current_app_class.name if hasattr(current_app_class, 'name') else 'App'}")
+        # Bind hot methods to locals once (avoids attribute lookups every frame)
+        run_app_frame = self._run_app_frame
+        run_tick_frame = self._run_tick_frame
+        log = self.log
+        log_debug = log.debug
+        log_info = log.info
+        log_error = log.error
+
+        log_info(f"Booting {self.device.name}")
+        log_info(f"Starting {getattr(current_app_class, 'name', 'App')}")
 
         # Frame state for rate limiting
-        frame_state = {'last_frame_time': time.time()}
+        frame_state = {'last_frame_time': ticks_us()}
 
         # Main OS loop - keeps running, switching between apps
         while True:
             # 1. CREATE APP INSTANCE
             app = current_app_class(self)
+            app_name = getattr(app, 'name', 'Unknown App')  # Resolved once per launch
             app_generator = None
             exit_reason = 'normal'
 
@@ -976,17 +1381,28 @@ class System:
             try:
                 # 3. CALL APP LIFECYCLE HOOKS
                 # on_enter: App can initialize, show loading screen, etc.
-                self.log.debug(f"Calling on_enter for {app.name if hasattr(app, 'name') else 'app'}")
-                try:
-                    app.on_enter()
-                except Exception as e:
-                    self.log.error(f"Error in on_enter: {e}")
-
-                # 4. START APP GENERATOR
-                # This calls app.run() which returns a generator
-                self.log.debug(f"Creating generator for {app.name if hasattr(app, 'name') else 'app'}")
-                app_generator = app.run()
-                self.log.debug("Generator created, entering event loop")
+                # (every debug call is guarded, so nothing is formatted or
+                # called for it unless debug logging is on)
+                if log.debug_enabled:
+                    log_debug(f"Calling on_enter for {app_name}")
+                self._call_app_hook(app.on_enter, 'on_enter')
+
+                # 4. START APP
+                if app.tick is not None:
+                    # tick() protocol - OS calls app.tick() every frame
+                    run_frame = run_tick_frame
+                    frame_target = app.tick
+                    if log.debug_enabled:
+                        log_debug("Using tick(), entering event loop")
+                else:
+                    # Generator protocol - this calls app.run() which returns a generator
+                    if log.debug_enabled:
+                        log_debug(f"Creating generator for {app_name}")
+                    app_generator = app.run()
+                    run_frame = run_app_frame
+                    frame_target = app_generator
+                    if log.debug_enabled:
+                        log_debug("Generator created, entering event loop")
 
                 # 5. RUN EVENT LOOP
                 # Each iteration:
@@ -996,43 +1412,38 @@ class System:
                 #   - OS updates toolbar and handles frame timing
                 while True:
                     # Run one frame of the app
-                    continue_running, exit_reason, next_app = self._run_app_frame(app_generator, frame_state)
+                    continue_running, exit_reason, next_app = run_frame(frame_target, frame_state)
 
                     if not continue_running:
                         # App wants to exit
                         if exit_reason == 'launch':
                             current_app_class = next_app
-                            self.log.info(f"Launching {current_app_class.name if hasattr(current_app_class, 'name') else 'App'}")
+                            log_info(f"Launching {getattr(current_app_class, 'name', 'App')}")
                         else:
                             # Normal exit - return to launcher
                             current_app_class = initial_app_class
-                            self.log.info("App exited normally")
+                            log_info("App exited normally")
                         break
 
                 # 6. CALL on_exit HOOK (only for normal exits, not crashes)
-                self.log.debug(f"Calling on_exit({exit_reason})")
-                try:
-                    app.on_exit(reason=exit_reason)
-                except Exception as e:
-                    self.log.error(f"Error in on_exit: {e}")
+                if log.debug_enabled:
+                    log_debug(f"Calling on_exit({exit_reason})")
+                self._call_app_hook(app.on_exit, 'on_exit', reason=exit_reason)
 
             except KeyboardInterrupt:
                 # User pressed Ctrl+C
-                self.log.info("Interrupted by user")
+                log_info("Interrupted by user")
                 exit_reason = 'interrupt'
                 current_app_class = initial_app_class
 
-                try:
-                    app.on_exit(reason=exit_reason)
-                except Exception as e:
-                    self.log.error(f"Error in on_exit: {e}")
+                self._call_app_hook(app.on_exit, 'on_exit', reason=exit_reason)
 
             except Exception as e:
                 # App crashed - show error screen
-                self.log.error(f"App crashed: {type(e).__name__}: {e}")
+                log_error(f"App crashed: {type(e).__name__}: {e}")
 
                 self._show_crash_screen(
-                    app_name=app.name if hasattr(app, 'name') else "Unknown App",
+                    app_name=app_name,
                     error=f"{type(e).__name__}: {str(e)}"
                 )
 
@@ -1041,15 +1452,17 @@ class System:
 
             finally:
                 # 7. CLEANUP (ALWAYS runs, even on crash)
-                self.log.debug("Calling on_cleanup")
-                try:
-                    app.on_cleanup()
-                except Exception as e:
-                    self.log.error(f"Error in on_cleanup: {e}")
+                if log.debug_enabled:
+                    log_debug("Calling on_cleanup")
+                self._call_app_hook(app.on_cleanup, 'on_cleanup')
 
                 # Clean up resources
                 self._cleanup_app(app, app_generator)
 
+                # Drop this loop's references so the app is actually garbage
+                app = app_generator = frame_target = None
+                self._reclaim_app_memory()
+
     def _show_crash_screen(self, app_name, error):
         """
         Show a crash screen briefly.
@@ -1059,35 +1472,62 @@ class System:
             error: Error message
         """
         try:
+            # The heap may be fragmented/near-full after a crash - reclaim
+            # the crashed app's garbage before allocating anything
+            gc.collect()
+
             self.reset_display()
-            self.clear((128, 0, 0))  # Dark red
-            self.draw_text("APP CRASHED", 10, 10, scale=2, color=(255, 255, 255))
-            self.draw_text(f"App: {app_name}", 10, 40, scale=1, color=(255, 255, 255))
-            self.draw_text("Error:", 10, 60, scale=1, color=(255, 255, 255))
+            white = self._pen_white
+            self.clear(self.make_pen(128, 0, 0))  # Dark red
+            self.draw_text("APP CRASHED", 10, 10, scale=2, color=white)
+            # Label and name drawn separately to avoid building a new string
+            self.draw_text("App:", 10, 40, scale=1, color=white)
+            self.draw_text(app_name, 10 + self.measure_text("App: "), 40, scale=1, color=white)
+            self.draw_text("Error:", 10, 60, scale=1, color=white)
 
             # Word wrap error message
-            error_lines = self._word_wrap(error, 38)  # ~38 chars per line at scale 1
+            error_lines = self._word_wrap(error, 38, max_lines=5)  # ~38 chars per line at scale 1
             y = 80
-            for line in error_lines[:5]:  # Max 5 lines
-                self.draw_text(line, 10, y, scale=1, color=(255, 200, 200))
+            error_pen = self.make_pen(255, 200, 200)
+            for line in error_lines:
+                self.draw_text(line, 10, y, scale=1, color=error_pen)
                 y += 12
 
-            self.draw_text("Returning to launcher...", 10, self.height - 30, scale=1, color=(255, 255, 0))
+            self.draw_text("Returning to launcher...", 10, self.height - 30, scale=1, color=self._pen_yellow)
             self.update()
 
-            time.sleep(3)  # Show for 3 seconds
+            self._wait_ms(3000)  # Show for 3 seconds
         except Exception as e:
             # If we can't even show crash screen, just print and continue
             print(f"[OS] Failed to show crash screen: {e}")
-            time.sleep(1)
+            self._wait_ms(1000)
+
+    def _wait_ms(self, duration_ms):
+        """
+        Wait while keeping the watchdog fed.
+
+        Use instead of a long time.sleep() outside the frame loop, so a
+        short hardware watchdog timeout doesn't reset the device.
+
+        Args:
+            duration_ms: Time to wait in milliseconds
+        """
+        deadline = ticks_add(ticks_ms(), duration_ms)
+        while True:
+            self._wdt_feed()
+            remaining = ticks_diff(deadline, ticks_ms())
+            if remaining <= 0:
+                break
+            sleep_ms(min(remaining, 100))
 
-    def _word_wrap(self, text, width):
+    def _word_wrap(self, text, width, max_lines=None):
         """
         Simple word wrap.
 
         Args:
             text: String to wrap
             width: Maximum characters per line
+            max_lines: Stop after this many lines (None for no limit)
 
         Returns:
             List of lines
@@ -1095,19 +1535,36 @@ class System:
         if len(text) <= width:
             return [text]
 
+        # Treat line breaks like spaces (one copy, only if needed)
+        if '\n' in text:
+            text = text.replace('\n', ' ')
+
+        # Single forward walk over indices - the only strings created are
+        # the returned lines (no per-word strings or concatenations)
         lines = []
-        while text:
-            if len(text) <= width:
-                lines.append(text)
+        n = len(text)
+        start = 0
+        while start < n:
+            # Skip spaces at the start of a line
+            while start < n and text[start] == ' ':
+                start += 1
+            if start >= n:
                 break
 
-            # Find last space before width
-            split_pos = text.rfind(' ', 0, width)
-            if split_pos == -1:
-                # No space found, hard break
-                split_pos = width
+            # Rest fits on one line
+            if n - start <= width:
+                lines.append(text[start:])
+                break
+
+            # Break at the last space that fits, or hard break a long word
+            end = text.rfind(' ', start, start + width + 1)
+            if end <= start:
+                end = start + width
+            lines.append(text[start:end])
+            start = end
 
-            lines.append(text[:split_pos])
-            text = text[split_pos:].lstrip()
+            # Caller only shows max_lines - skip wrapping the rest
+            if max_lines is not None and len(lines) >= max_lines:
+                break
 
-        return lines
+        return lines[:max_lines]
@@ -8,26 +8,37 @@ import os
 import sys
 import json
 import hashlib
+import mmap
 import subprocess
 import argparse
 import serial
 import serial.tools.list_ports
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Set, List
 
 
 class PicoDeployer:
-    def __init__(self, source_dir: str, clean: bool = False, verbose: bool = False):
+    UPLOAD_BATCH_SIZE = 50  # Files per mpremote invocation
+    MMAP_HASH_MIN_SIZE = 64 * 1024  # Hash files this big via mmap
+
+    def __init__(self, source_dir: str, clean: bool = False, verbose: bool = False,
+                 frozen: bool = False, mpy: bool = False):
         self.source_dir = Path(source_dir).resolve()
         self.clean = clean
         self.verbose = verbose
+        self.frozen = frozen
+        self.mpy = mpy
+        self.build_dir = self.source_dir.parent / ".mpy_build"
         self.cache_file = self.source_dir.parent / ".deploy_cache.json"
         self.ignore_file = self.source_dir.parent / "slime_os_2" / ".slime_ignore"
         self.ignore_patterns: List[str] = []
-        self.file_hashes: Dict[str, str] = {}
+        # Cache entries: {"h": sha256 hex, "m": mtime, "s": size}
+        self.file_hashes: Dict[str, dict] = {}
         self.uploaded_count = 0
         self.skipped_count = 0
+        self.port = None  # Serial port found by check_device()
 
     def load_ignore_patterns(self):
         """Load patterns from .slime_ignore file"""
@@ -40,7 +51,7 @@ class PicoDeployer:
                 ]
 
 
-    def load_cache(self) -> Dict[str, str]:
+    def load_cache(self) -> Dict[str, dict]:
         """Load previously stored file hashes"""
         if self.clean or not self.cache_file.exists():
             return {}
@@ -63,13 +74,25 @@ class PicoDeployer:
         """Compute SHA256 hash of a file"""
         sha256 = hashlib.sha256()
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                sha256.update(chunk)
+            size = os.fstat(f.fileno()).st_size
+            if size >= self.MMAP_HASH_MIN_SIZE:
+                # Large file - hash straight from the page cache, no copies
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    sha256.update(mm)
+            else:
+                # Small file - one read beats a Python-level chunk loop
+                sha256.update(f.read())
         return sha256.hexdigest()
 
     def should_ignore(self, path: Path) -> bool:
         """Check if path matches any ignore pattern"""
         rel_path = str(path.relative_to(self.source_dir))
+
+        # OS core is frozen into the firmware (see manifest.py) - a copy on the
+        # filesystem would shadow the frozen modules
+        if self.frozen and path.suffix == '.py' and Path(rel_path).parts[0] == 'slime':
+            return True
+
         for pattern in self.ignore_patterns:
             # Simple pattern matching
             if pattern.startswith('*'):
@@ -91,8 +114,71 @@ class PicoDeployer:
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
 
+    def check_mpy_cross(self) -> bool:
+        """Check if mpy-cross is installed"""
+        try:
+            subprocess.run(['mpy-cross', '--version'],
+                         capture_output=True,
+                         check=True)
+            return True
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return False
+
+    def should_compile(self, rel_path: Path) -> bool:
+        """Check if a file should be uploaded as precompiled .mpy bytecode"""
+        # main.py/boot.py at the root are run by the firmware as .py files
+        if not self.mpy or rel_path.suffix != '.py':
+            return False
+        return not (len(rel_path.parts) == 1 and rel_path.name in ('main.py', 'boot.py'))
+
+    def compile_mpy(self, local_path: Path, rel_path: Path) -> Path:
+        """
+        Cross-compile a .py file to .mpy bytecode for the RP2040.
+
+        -O3 strips asserts and line numbers, so modules import faster and
+        their bytecode takes less RAM than compiling the .py on the device.
+
+        Returns:
+            Path to the compiled .mpy file, or None on failure
+        """
+        out_path = self.build_dir / rel_path.with_suffix('.mpy')
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            subprocess.run(['mpy-cross', '-march=armv6m', '-O3',
+                            '-s', str(rel_path).replace('\\', '/'),
+                            '-o', str(out_path), str(local_path)],
+                         capture_output=True,
+                         check=True,
+                         timeout=30)
+            return out_path
+        except subprocess.CalledProcessError as e:
+            print(f"    ERROR compiling {rel_path}: {e.stderr.decode().strip()}")
+            return None
+        except subprocess.TimeoutExpired:
+            print(f"    ERROR compiling {rel_path}: mpy-cross timed out")
+            return None
+
+    def mpremote_cmd(self, *args: str) -> List[str]:
+        """
+        Build an mpremote command line.
+
+        Once check_device() has found the Pico's port it is passed with
+        'connect', so mpremote doesn't scan for a device on every call.
+
+        Returns:
+            Argument list for subprocess.run()
+        """
+        if self.port:
+            return ['mpremote', 'connect', self.port, *args]
+        return ['mpremote', *args]
+
     def check_device(self) -> bool:
-        """Check if Pico is connected"""
+        """Check if Pico is connected, remembering its serial port"""
+        self.port = self.find_pico_port()
+        if self.port:
+            return True
+
+        # Not recognised by USB ID - let mpremote look for any device
         try:
             result = subprocess.run(['mpremote', 'connect', 'list'],
                                   capture_output=True,
@@ -114,7 +200,7 @@ class PicoDeployer:
         """Force interrupt the running program"""
         print("Forcing interrupt to stop running code...")
 
-        port = self.find_pico_port()
+        port = self.port or self.find_pico_port()
         if not port:
             print("⚠ Could not find Pico serial port for interrupt")
             return False
@@ -139,32 +225,53 @@ class PicoDeployer:
             print(f"⚠ Interrupt failed: {e}")
             return False
 
-    def mkdir_remote(self, remote_path: str):
-        """Create directory on Pico"""
-        try:
-            subprocess.run(['mpremote', 'mkdir', f':{remote_path}'],
-                         capture_output=True,
-                         timeout=10)
-        except Exception as e:
+    def upload_batch(self, uploads: List[tuple], remote_dirs: List[str] = (),
+                     stale_paths: List[str] = ()) -> bool:
+        """
+        Upload files to Pico in a single mpremote session.
+
+        mpremote runs commands chained with '+' over one connection, so the
+        serial open and REPL handshake are paid once per batch rather than
+        once per file and directory. Directories are created and stale files
+        removed first by one exec, which skips ones that already exist or
+        are already gone.
+
+        Args:
+            uploads: List of (local_path, remote_path) pairs
+            remote_dirs: Remote directories to create, parents first
+            stale_paths: Remote files to remove before uploading
+
+        Returns:
+            True if every command in the batch succeeded
+        """
+        commands = []
+        setup = [f"try: os.mkdir({d!r})\nexcept OSError: pass" for d in remote_dirs]
+        setup += [f"try: os.remove({p!r})\nexcept OSError: pass" for p in stale_paths]
+        if setup:
+            commands.append(['exec', '\n'.join(['import os'] + setup)])
+
+        for local_path, remote_path in uploads:
             if self.verbose:
-                print(f"    (mkdir {remote_path} skipped: {e})")
-
-    def upload_file(self, local_path: Path, remote_path: str) -> bool:
-        """Upload a single file to Pico"""
-        try:
-            if self.verbose:
-                print(f"  → {local_path.relative_to(self.source_dir)} → :{remote_path}")
+                print(f"  → {local_path} → :{remote_path}")
             else:
-                print(f"  → {local_path.relative_to(self.source_dir)}")
+                print(f"  → {remote_path}")
+            commands.append(['cp', str(local_path), f':{remote_path}'])
+
+        cmd = self.mpremote_cmd()
+        for i, command in enumerate(commands):
+            if i:
+                cmd.append('+')
+            cmd.extend(command)
 
-            subprocess.run(['mpremote', 'cp', str(local_path), f':{remote_path}'],
+        try:
+            subprocess.run(cmd,
                          capture_output=not self.verbose,
                          check=True,
-                         timeout=30)
-            self.uploaded_count += 1
+                         timeout=10 + 30 * len(uploads))
+            self.uploaded_count += len(uploads)
             return True
         except subprocess.CalledProcessError as e:
-            print(f"    ERROR uploading {local_path}: {e}")
+            print(f"    ERROR uploading batch of {len(uploads)} files: {e}")
             return False
         except Exception as e:
             print(f"    ERROR: {e}")
@@ -174,6 +281,8 @@ class PicoDeployer:
         """Recursively process and upload directory"""
         old_cache = self.load_cache() if not self.clean else {}
 
+        # Walk first, so every file needing a hash is known before uploading
+        files = []
         for item in sorted(local_dir.rglob('*')):
             if not item.is_file():
                 continue
@@ -186,33 +295,84 @@ class PicoDeployer:
 
             # Calculate relative path
             rel_path = item.relative_to(self.source_dir)
+            compile_mpy = self.should_compile(rel_path)
+            if compile_mpy:
+                rel_path = rel_path.with_suffix('.mpy')
+
+            # Cache is keyed by the uploaded name; hash is of the source
+            cached = old_cache.get(str(rel_path))
+            st = item.stat()
+
+            # Same mtime and size as last deploy - unchanged, without reading it
+            stat_match = (isinstance(cached, dict) and cached.get('m') == st.st_mtime
+                          and cached.get('s') == st.st_size)
+            files.append((item, rel_path, compile_mpy, cached, st, stat_match))
+
+        # Hash the rest in parallel - reads and SHA-256 overlap across files,
+        # while uploads below stay serial (one serial port)
+        to_hash = [item for item, *_, stat_match in files if not stat_match]
+        hashes = {}
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                hashes = dict(zip(to_hash, executor.map(self.compute_hash, to_hash)))
+
+        # Changed files are queued, then uploaded together below
+        pending = []
+        remote_dirs: Set[str] = set()
+        stale_paths: List[str] = []
+        for item, rel_path, compile_mpy, cached, st, stat_match in files:
             remote_path = str(rel_path).replace('\\', '/')
-
-            # Compute hash
-            file_hash = self.compute_hash(item)
             cache_key = str(rel_path)
 
+            if stat_match:
+                file_hash = cached['h']
+                unchanged = True
+            else:
+                # Stat changed (or old hash-only cache entry) - compare content,
+                # so a touched-but-identical file isn't re-uploaded
+                file_hash = hashes[item]
+                cached_hash = cached.get('h') if isinstance(cached, dict) else cached
+                unchanged = (cached_hash == file_hash)
+            entry = {'h': file_hash, 'm': st.st_mtime, 's': st.st_size}
+
             # Check if file changed
-            if not self.clean and cache_key in old_cache and old_cache[cache_key] == file_hash:
+            if unchanged:
                 if self.verbose:
                     print(f"  ✓ {rel_path} (unchanged)")
                 self.skipped_count += 1
-                self.file_hashes[cache_key] = file_hash
+                self.file_hashes[cache_key] = entry
                 continue
 
-            # Create remote directory if needed
-            remote_parent = str(Path(remote_path).parent)
-            if remote_parent and remote_parent != '.':
-                self.mkdir_remote(remote_parent)
-
-            # Upload file
-            if self.upload_file(item, remote_path):
-                self.file_hashes[cache_key] = file_hash
+            # Create remote directory (and its parents) if needed
+            for parent in Path(remote_path).parents:
+                if str(parent) != '.':
+                    remote_dirs.add(parent.as_posix())
+
+            upload_path = item
+            if compile_mpy:
+                upload_path = self.compile_mpy(item, item.relative_to(self.source_dir))
+                if upload_path is None:
+                    continue
+                # A stale .py on the device would be imported instead of the .mpy
+                stale_paths.append(remote_path[:-len('.mpy')] + '.py')
+
+            pending.append((upload_path, remote_path, cache_key, entry))
+
+        # Upload in batches - one mpremote session each, few enough files
+        # per batch to keep the command line short
+        for start in range(0, len(pending), self.UPLOAD_BATCH_SIZE):
+            batch = pending[start:start + self.UPLOAD_BATCH_SIZE]
+            first = (start == 0)
+            if self.upload_batch([(path, remote) for path, remote, _, _ in batch],
+                                 sorted(remote_dirs) if first else (),
+                                 stale_paths if first else ()):
+                for _, _, cache_key, entry in batch:
+                    self.file_hashes[cache_key] = entry
 
     def reset_device(self):
         """Reset the Pico"""
         try:
-            subprocess.run(['mpremote', 'reset'],
+            subprocess.run(self.mpremote_cmd('reset'),
                          capture_output=True,
                          timeout=10)
         except Exception as e:
@@ -243,6 +403,15 @@ class PicoDeployer:
             sys.exit(1)
         print("✓ mpremote found")
 
+        # Check mpy-cross
+        if self.mpy:
+            print("Checking for mpy-cross...")
+            if not self.check_mpy_cross():
+                print("ERROR: mpy-cross not found!")
+                print("Install with: pip3 install mpy-cross (match your firmware version)")
+                sys.exit(1)
+            print("✓ mpy-cross found")
+
         # Check device
         print("Checking for connected Pico...")
         if not self.check_device():
@@ -317,6 +486,16 @@ def main():
         default='../slime_os_2',
         help='Source directory to upload (default: ../slime_os_2)'
     )
+    parser.add_argument(
+        '--frozen',
+        action='store_true',
+        help='Skip slime/ .py files (firmware built with tools/manifest.py)'
+    )
+    parser.add_argument(
+        '--mpy',
+        action='store_true',
+        help='Upload .py modules precompiled to .mpy with mpy-cross (except main.py)'
+    )
 
     args = parser.parse_args()
 
@@ -327,7 +506,9 @@ def main():
     deployer = PicoDeployer(
         source_dir=str(source_dir),
         clean=args.clean,
-        verbose=args.verbose
+        verbose=args.verbose,
+        frozen=args.frozen,
+        mpy=args.mpy
     )
 
     try:
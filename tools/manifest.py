@@ -0,0 +1,21 @@
+# MicroPython firmware manifest for Slime OS 2
+#
+# Freezes the OS core (the `slime` package) into the firmware image so its
+# bytecode is executed from flash instead of being compiled into the GC heap
+# on every boot. The OS core is imported for the whole OS lifetime, so this
+# frees heap for apps and reduces fragmentation.
+#
+# Build (rp2 port):
+#   cd micropython/ports/rp2
+#   make BOARD=<your board> FROZEN_MANIFEST=/path/to/slime_os/tools/manifest.py
+#
+# Then deploy with `python deploy_to_pico.py --frozen` so the .py files of the
+# `slime` package are not uploaded (files on the filesystem take precedence
+# over frozen modules). Font files are still uploaded as they are read from
+# the filesystem at runtime.
+
+# Keep the board's default frozen modules
+include("$(PORT_DIR)/boards/manifest.py")
+
+# OS core: system kernel, app base class, logger, settings, devices and drivers
+package("slime", base_path="../slime_os_2", opt=3)